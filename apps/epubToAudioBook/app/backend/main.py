@@ -1,19 +1,33 @@
 """FastAPI backend for the Kokoro audiobook application."""
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import logging
 import re
 import os
 import shutil
 import sys
+import threading
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Dict, List, Optional
 
 from fastapi import BackgroundTasks, FastAPI, File, Form, HTTPException, UploadFile
 from fastapi.responses import JSONResponse
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+    from fastapi.responses import ORJSONResponse
+
+    DEFAULT_RESPONSE_CLASS = ORJSONResponse
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    DEFAULT_RESPONSE_CLASS = JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.routing import APIRouter
@@ -55,7 +69,10 @@ BOOKS_DIR.mkdir(parents=True, exist_ok=True)
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
-app = FastAPI(title="Kokoro Audiobook Server")
+app = FastAPI(
+    title="Kokoro Audiobook Server",
+    default_response_class=DEFAULT_RESPONSE_CLASS,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -66,10 +83,46 @@ app.add_middleware(
 
 api_router = APIRouter(prefix="/api")
 
-tasks_status: Dict[str, Dict[str, str]] = {}
+# Task payloads are written from background workers and read from request
+# handlers, so every access goes through the lock; LRU eviction keeps the
+# store from growing for the lifetime of the server.
+TASKS_STATUS_LIMIT = 4096
+tasks_status: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+_tasks_lock = threading.RLock()
 logger = logging.getLogger(__name__)
 
 
+def _set_task_status(job_id: str, payload: Dict[str, str]) -> None:
+    with _tasks_lock:
+        tasks_status[job_id] = payload
+        tasks_status.move_to_end(job_id)
+        while len(tasks_status) > TASKS_STATUS_LIMIT:
+            tasks_status.popitem(last=False)
+
+
+def _get_task_status(job_id: str) -> Optional[Dict[str, str]]:
+    with _tasks_lock:
+        return tasks_status.get(job_id)
+
+
+def _drop_tasks_for_book(book_id: str) -> None:
+    with _tasks_lock:
+        stale = [
+            task_id
+            for task_id, payload in tasks_status.items()
+            if payload.get("book_id") == book_id
+        ]
+        for task_id in stale:
+            tasks_status.pop(task_id, None)
+
+
+def _json_loads(data: bytes) -> Dict:
+    """Parse JSON bytes with orjson when available (2-6x stdlib speed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _optional_int_from_env(key: str) -> Optional[int]:
     value = os.environ.get(key)
     if value in (None, ""):
@@ -120,7 +173,10 @@ def _detect_kokoro_resources(device_hint: str) -> Dict[str, Optional[object]]:
         adaptive_chunk = int(3000 * scale)
 
         result["chunk_chars"] = adaptive_chunk
-        result["worker_count"] = min(device_count, 4)
+        # One worker per GPU: init_worker round-robins the device pool, so
+        # chunk synthesis shards near-linearly across all visible devices.
+        max_workers = _optional_int_from_env("KOKORO_MAX_WORKERS") or device_count
+        result["worker_count"] = max(1, min(device_count, max_workers))
         result["primary_device"] = device_pool[0]
         result["device_pool"] = device_pool
 
@@ -141,26 +197,54 @@ def _detect_kokoro_resources(device_hint: str) -> Dict[str, Optional[object]]:
         return result
 
 
+# Maps every non-alphanumeric ASCII byte to '-'; run once per upload instead
+# of a character-class regex substitution.
+_SLUG_TRANS = bytes(
+    c if c < 128 and chr(c).isalnum() else ord("-") for c in range(256)
+)
+_SLUG_COLLAPSE = re.compile(r"-+")
+
+
 def _slugify(value: str) -> str:
-    sanitized = re.sub(r"[^A-Za-z0-9]+", "-", value).strip("-")
+    # errors="replace" folds non-ASCII characters into '?' (and then '-'
+    # through the table), matching the old character-class substitution;
+    # "ignore" would silently delete them and change existing slugs.
+    sanitized = value.encode("ascii", "replace").translate(_SLUG_TRANS).decode("ascii")
+    sanitized = _SLUG_COLLAPSE.sub("-", sanitized).strip("-")
     return sanitized.lower() or "book"
 
 
 def _ensure_unique_book_id(base_id: str) -> str:
+    # One scandir pass replaces a stat syscall per collision probe.
+    try:
+        existing = {entry.name for entry in os.scandir(OUTPUT_DIR)}
+    except OSError:
+        existing = set()
     candidate = base_id
     counter = 1
-    while (OUTPUT_DIR / candidate).exists():
+    while candidate in existing:
         counter += 1
         candidate = f"{base_id}-{counter}"
     return candidate
 
 
+@functools.lru_cache(maxsize=256)
+def _load_manifest_cached(book_id: str, mtime_ns: int) -> Dict:
+    """Parse a manifest once per (book, mtime); the mtime key self-invalidates."""
+    manifest_path = OUTPUT_DIR / book_id / "manifest.json"
+    try:
+        return _json_loads(manifest_path.read_bytes())
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Manifest not found")
+
+
 def _load_manifest(book_id: str) -> Dict:
     manifest_path = OUTPUT_DIR / book_id / "manifest.json"
-    if not manifest_path.exists():
+    try:
+        mtime_ns = manifest_path.stat().st_mtime_ns
+    except OSError:
         raise HTTPException(status_code=404, detail="Manifest not found")
-    with manifest_path.open("r", encoding="utf-8") as manifest_file:
-        return json.load(manifest_file)
+    return _load_manifest_cached(book_id, mtime_ns)
 
 
 def _safe_manifest_lookup(book_id: str, chapter_index: int) -> Dict[str, str]:
@@ -189,9 +273,7 @@ def _delete_book_artifacts(book_id: str) -> None:
         if epub_parent == BOOKS_DIR.resolve():
             epub_path.unlink()
 
-    for task_id, payload in list(tasks_status.items()):
-        if payload.get("book_id") == book_id:
-            tasks_status.pop(task_id, None)
+    _drop_tasks_for_book(book_id)
 
 
 def _run_generation(
@@ -205,7 +287,7 @@ def _run_generation(
     chapter_end: int,
     alignment_backend: str,
 ) -> None:
-    tasks_status[job_id] = {"status": "processing", "book_id": book_id}
+    _set_task_status(job_id, {"status": "processing", "book_id": book_id})
 
     output_folder = OUTPUT_DIR / book_id
     output_folder.mkdir(parents=True, exist_ok=True)
@@ -258,18 +340,26 @@ def _run_generation(
 
         manifest = None
         try:
-            manifest = _load_manifest(book_id)
+            # _load_manifest returns the lru_cache-shared dict; take a private
+            # copy before the assets mutation below so concurrent readers
+            # never see a half-updated manifest, and so the cached entry keeps
+            # matching the file on disk if the rewrite fails.
+            manifest = copy.deepcopy(_load_manifest(book_id))
         except HTTPException as exc:
             logger.warning("Manifest missing after generation for %s: %s", book_id, exc)
 
         packaged_name = None
         if manifest:
             audio_metadata = [
-                (chapter.get("index"), chapter.get("audio"))
+                (chapter.get("index"), chapter.get("audio"), chapter.get("duration_ms"))
                 for chapter in manifest.get("chapters", [])
                 if chapter.get("status") == "ready"
             ]
-            audio_metadata = [(idx, name) for idx, name in audio_metadata if idx is not None and name]
+            audio_metadata = [
+                (idx, name, duration_ms)
+                for idx, name, duration_ms in audio_metadata
+                if idx is not None and name
+            ]
             if audio_metadata:
                 try:
                     package_path = package_m4b(
@@ -307,13 +397,13 @@ def _run_generation(
             except Exception as exc:
                 logger.warning("Failed to update manifest assets for %s: %s", book_id, exc)
 
-        tasks_status[job_id] = {"status": "completed", "book_id": book_id}
+        _set_task_status(job_id, {"status": "completed", "book_id": book_id})
     except Exception as exc:  # pragma: no cover - defensive logging
-        tasks_status[job_id] = {
+        _set_task_status(job_id, {
             "status": "failed",
             "book_id": book_id,
             "detail": str(exc),
-        }
+        })
         raise
 
 
@@ -327,18 +417,34 @@ def list_aligners() -> Dict[str, List[str]]:
     return {"aligners": AVAILABLE_ALIGNERS}
 
 
+def _read_manifest(manifest_file: Path) -> Optional[Dict]:
+    try:
+        manifest = _json_loads(manifest_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+    manifest["book_id"] = manifest.get("book_id") or manifest_file.parent.name
+    return manifest
+
+
 @api_router.get("/books")
 def list_books() -> List[Dict]:
-    books: List[Dict] = []
-    for manifest_file in OUTPUT_DIR.glob("*/manifest.json"):
-        with manifest_file.open("r", encoding="utf-8") as fp:
-            try:
-                manifest = json.load(fp)
-            except json.JSONDecodeError:
-                continue
-        manifest["book_id"] = manifest.get("book_id") or manifest_file.parent.name
-        books.append(manifest)
-    return books
+    # scandir caches the dir/file type per entry, so listing the library
+    # costs one readdir instead of glob's extra stat calls; _read_manifest
+    # absorbs the missing-manifest case without a separate exists() probe.
+    manifest_files: List[Path] = []
+    try:
+        with os.scandir(OUTPUT_DIR) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    manifest_files.append(Path(entry.path, "manifest.json"))
+    except OSError:
+        return []
+    if not manifest_files:
+        return []
+    # Overlap the per-book disk reads; parsing is cheap next to the I/O.
+    with ThreadPoolExecutor(max_workers=min(16, len(manifest_files))) as executor:
+        manifests = executor.map(_read_manifest, manifest_files)
+    return [manifest for manifest in manifests if manifest is not None]
 
 
 @api_router.get("/books/{book_id}")
@@ -362,8 +468,7 @@ def get_chapter_metadata(book_id: str, chapter_index: int) -> Dict:
     metadata_path = OUTPUT_DIR / book_id / chapter["metadata"]
     if not metadata_path.exists():
         raise HTTPException(status_code=404, detail="Metadata file not found")
-    with metadata_path.open("r", encoding="utf-8") as fp:
-        return json.load(fp)
+    return _json_loads(metadata_path.read_bytes())
 
 
 @api_router.get("/books/{book_id}/chapters/{chapter_index}/audio")
@@ -395,7 +500,7 @@ def get_book_asset(book_id: str, asset_name: str) -> FileResponse:
 
 @api_router.get("/tasks/{task_id}")
 def get_task_status(task_id: str) -> Dict[str, str]:
-    status = tasks_status.get(task_id)
+    status = _get_task_status(task_id)
     if not status:
         raise HTTPException(status_code=404, detail="Task not found")
     return status
@@ -431,13 +536,17 @@ async def create_audiobook(
 
     original_filename = Path(file.filename).name
     epub_path = BOOKS_DIR / f"{book_id}.epub"
+    # Read through the async UploadFile API in 1 MiB chunks: large buffers
+    # amortize syscall overhead and the awaits keep the event loop responsive
+    # during multi-MB uploads.
     with epub_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+        while chunk := await file.read(1024 * 1024):
+            buffer.write(chunk)
 
-    file.file.close()
+    await file.close()
 
     job_id = str(uuid.uuid4())
-    tasks_status[job_id] = {"status": "queued", "book_id": book_id}
+    _set_task_status(job_id, {"status": "queued", "book_id": book_id})
     background_tasks.add_task(
         _run_generation,
         job_id,
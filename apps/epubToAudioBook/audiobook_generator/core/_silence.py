@@ -0,0 +1,101 @@
+"""Fused amplitude/silence scan used by chunk audio analysis.
+
+One native-code pass over the waveform computes the peak amplitude and the
+first/last samples above the adaptive threshold, replacing the chain of
+temporary arrays (abs, mask, reversed view) the NumPy version allocates.
+Numba is optional: without it the NumPy implementation is used unchanged.
+"""
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+# Absolute noise floor and peak-relative factor for the silence threshold.
+NOISE_FLOOR = 1e-4
+RELATIVE_THRESHOLD = 0.005
+
+
+def _bounds_mono_py(x):
+    amplitudes = np.abs(x)
+    max_amplitude = float(amplitudes.max()) if amplitudes.size else 0.0
+    threshold = max(NOISE_FLOOR, max_amplitude * RELATIVE_THRESHOLD)
+    mask = amplitudes >= threshold
+    if not mask.any():
+        return max_amplitude, -1, -1
+    first = int(np.argmax(mask))
+    last = len(mask) - 1 - int(np.argmax(mask[::-1]))
+    return max_amplitude, first, last
+
+
+def _bounds_multi_py(x):
+    amplitudes = np.max(np.abs(x), axis=1)
+    return _bounds_mono_py(amplitudes)
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _bounds_mono_jit(x):  # pragma: no cover - exercised via silence_bounds
+        n = x.shape[0]
+        max_amplitude = 0.0
+        for i in range(n):
+            value = abs(x[i])
+            if value > max_amplitude:
+                max_amplitude = value
+        threshold = max_amplitude * RELATIVE_THRESHOLD
+        if threshold < NOISE_FLOOR:
+            threshold = NOISE_FLOOR
+        first = -1
+        for i in range(n):
+            if abs(x[i]) >= threshold:
+                first = i
+                break
+        if first < 0:
+            return max_amplitude, -1, -1
+        last = first
+        for i in range(n - 1, first - 1, -1):
+            if abs(x[i]) >= threshold:
+                last = i
+                break
+        return max_amplitude, first, last
+
+    @njit(cache=True, fastmath=True)
+    def _bounds_multi_jit(x):  # pragma: no cover - exercised via silence_bounds
+        n = x.shape[0]
+        channels = x.shape[1]
+        amplitudes = np.empty(n, dtype=np.float32)
+        for i in range(n):
+            peak = 0.0
+            for c in range(channels):
+                value = abs(x[i, c])
+                if value > peak:
+                    peak = value
+            amplitudes[i] = peak
+        return _bounds_mono_jit(amplitudes)
+
+
+def silence_bounds(data):
+    """Return ``(max_amplitude, first_nonsilent, last_nonsilent)``.
+
+    ``first``/``last`` are sample indices above the adaptive threshold, or
+    ``-1`` when the whole buffer is below it. Accepts mono ``(n,)`` or
+    multi-channel ``(n, channels)`` float arrays.
+    """
+    if data.ndim > 1:
+        if njit is not None:
+            return _bounds_multi_jit(np.ascontiguousarray(data))
+        return _bounds_multi_py(data)
+    if njit is not None:
+        return _bounds_mono_jit(np.ascontiguousarray(data))
+    return _bounds_mono_py(data)
+
+
+def warm_up():
+    """Trigger JIT compilation so the first real chunk doesn't pay for it."""
+    if njit is None:
+        return
+    probe = np.zeros(1, dtype=np.float32)
+    _bounds_mono_jit(probe)
+    _bounds_multi_jit(probe.reshape(1, 1))
@@ -1,13 +1,70 @@
 """Utilities for aligning chapter text to audio using selectable backends."""
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    from rapidfuzz.distance import Levenshtein as _RapidfuzzLevenshtein
+except ImportError:  # pragma: no cover - optional dependency
+    _RapidfuzzLevenshtein = None
 
 logger = logging.getLogger(__name__)
 
+# Loading an ASR or alignment model costs seconds; when alignment runs
+# chapter-by-chapter those reloads dominate wall time. Cache loaded models at
+# module scope, keyed by (model_id, device) / (language, device).
+_MODEL_CACHE_LOCK = threading.Lock()
+_ASR_CACHE: Dict[tuple, object] = {}
+_ALIGN_CACHE: Dict[tuple, tuple] = {}
+
+# Transcribing a chapter is the most expensive alignment step by far; retries
+# and backend fallbacks hit the same audio file, so memoize the transcription
+# keyed by file identity (path + mtime + size) and model/device. Bounded as a
+# small LRU: entries hold every segment's text, the reuse window is only
+# retries on the same file, and a long-lived server would otherwise
+# accumulate one payload per chapter ever aligned.
+TRANSCRIPT_CACHE_LIMIT = 8
+_TRANSCRIPT_CACHE: "OrderedDict[tuple, Dict[str, object]]" = OrderedDict()
+
+
+def _transcript_cache_get(cache_key: Optional[tuple]) -> Optional[Dict[str, object]]:
+    if cache_key is None:
+        return None
+    with _MODEL_CACHE_LOCK:
+        result = _TRANSCRIPT_CACHE.get(cache_key)
+        if result is not None:
+            _TRANSCRIPT_CACHE.move_to_end(cache_key)
+        return result
+
+
+def _transcript_cache_put(cache_key: tuple, result: Dict[str, object]) -> None:
+    with _MODEL_CACHE_LOCK:
+        _TRANSCRIPT_CACHE[cache_key] = result
+        _TRANSCRIPT_CACHE.move_to_end(cache_key)
+        while len(_TRANSCRIPT_CACHE) > TRANSCRIPT_CACHE_LIMIT:
+            _TRANSCRIPT_CACHE.popitem(last=False)
+
+
+def _transcript_cache_key(
+    audio_path: str, model_id: str, device: str
+) -> Optional[tuple]:
+    try:
+        stat = os.stat(audio_path)
+    except OSError:
+        return None
+    return (audio_path, stat.st_mtime_ns, stat.st_size, model_id, device)
+
 SUPPORTED_ALIGNERS = {"whisperx", "nemo", "torchaudio"}
 
 LANGUAGE_MAP = {
@@ -20,118 +77,614 @@ LANGUAGE_MAP = {
 
 TOKEN_NORMALIZER = re.compile(r"[^0-9a-z]+", re.IGNORECASE)
 
+_WORD_CHAR_RE = re.compile(r"\w")
+
+# Deletes every ASCII character outside [0-9a-z]; applied after .lower() so a
+# single C-level translate pass replaces the regex substitution for the common
+# all-ASCII token case.
+_ASCII_STRIP = str.maketrans({
+    char: None
+    for char in map(chr, range(128))
+    if not ("0" <= char <= "9" or "a" <= char <= "z")
+})
+
+# Bail out of the Myers diff once the edit distance exceeds this fraction of
+# the combined sequence length; beyond that the trace snapshots grow quadratic
+# and SequenceMatcher is no worse.
+MYERS_MAX_EFFORT = 0.3
+
+
+class Timing(NamedTuple):
+    """Start/end of one token in seconds.
 
+    A NamedTuple instead of a ``{"start", "end"}`` dict: at tens of thousands
+    of tokens per book the tuple is a quarter of the memory, and ``t.start``
+    is a C-level index rather than a hash lookup.
+    """
+
+    start: float
+    end: float
+
+
+# Chunks per forward pass for faster-whisper's batched pipeline; matches the
+# default batch size used for the whisperx fallback path.
+FASTER_WHISPER_BATCH_SIZE = 16
+
+# Whisper-family models consume 16 kHz mono; callers handing over in-memory
+# audio are resampled here instead of decoding the file they just wrote.
+WHISPER_SAMPLE_RATE = 16000
+
+
+def _resample_for_whisper(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Downmix and linear-resample an in-memory buffer to Whisper's 16 kHz.
+
+    Linear interpolation is plenty for alignment: the transcript only has to
+    be close enough for the token diff, not presentation-quality.
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    if audio.size == 0 or sample_rate == WHISPER_SAMPLE_RATE:
+        return audio
+    target = int(round(audio.size * WHISPER_SAMPLE_RATE / sample_rate))
+    positions = np.linspace(0.0, audio.size - 1, max(target, 1))
+    return np.interp(positions, np.arange(audio.size), audio).astype(np.float32)
+
+
+# Drops spaces and folds underscores to hyphens in one translate pass instead
+# of chained .replace() calls.
+_LANG_TRANS = str.maketrans({" ": None, "_": "-"})
+
+
+@functools.lru_cache(maxsize=32)
 def _normalize_language(language: Optional[str]) -> Optional[str]:
     if not language:
         return None
-    key = language.replace(" ", "").replace("_", "-").lower()
+    key = language.translate(_LANG_TRANS).lower()
     if key in LANGUAGE_MAP:
         return LANGUAGE_MAP[key]
     return key[:2]
 
 
 def _normalize_token(token: str) -> str:
-    return TOKEN_NORMALIZER.sub("", token.lower())
+    lowered = token.lower()
+    if lowered.isascii():
+        return lowered.translate(_ASCII_STRIP)
+    return TOKEN_NORMALIZER.sub("", lowered)
+
+
+_CUDA_AVAILABLE: Optional[bool] = None
+_DEVICE_LOCK = threading.Lock()
+
+
+def _cuda_available() -> bool:
+    """Probe torch.cuda.is_available() once; the answer never changes at runtime."""
+    global _CUDA_AVAILABLE
+    if _CUDA_AVAILABLE is None:
+        with _DEVICE_LOCK:
+            if _CUDA_AVAILABLE is None:
+                try:  # pragma: no cover - torch is optional at runtime
+                    import torch
+
+                    _CUDA_AVAILABLE = bool(torch.cuda.is_available())
+                except Exception:  # pragma: no cover - optional dependency
+                    _CUDA_AVAILABLE = False
+    return _CUDA_AVAILABLE
 
 
 def _resolve_device_hint(device_hint: Optional[str]) -> str:
     if device_hint:
         return device_hint
-    try:  # pragma: no cover - torch is optional at runtime
-        import torch
+    return "cuda" if _cuda_available() else "cpu"
 
-        if torch.cuda.is_available():
-            return "cuda"
-    except Exception:  # pragma: no cover - optional dependency
-        pass
-    return "cpu"
+
+def _myers_opcodes(
+    a: List[str],
+    b: List[str],
+    max_effort: float = MYERS_MAX_EFFORT,
+) -> Optional[List[tuple[str, int, int, int, int]]]:
+    """Diff ``a`` against ``b`` using Myers' O((N+M)D) algorithm.
+
+    Returns opcodes in the same ``(tag, i1, i2, j1, j2)`` shape as
+    ``difflib.SequenceMatcher.get_opcodes`` so callers can consume either
+    interchangeably. Returns ``None`` when the edit distance exceeds
+    ``max_effort * (len(a) + len(b))``, signalling the caller to fall back.
+    """
+    n, m = len(a), len(b)
+    max_d = n + m
+    if max_d == 0:
+        return []
+    budget = max(1, int(max_effort * max_d))
+
+    v: Dict[int, int] = {1: 0}
+    trace: List[Dict[int, int]] = []
+    end_d = -1
+    for d in range(max_d + 1):
+        if d > budget:
+            return None
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v.get(k - 1, -1) < v.get(k + 1, -1)):
+                x = v.get(k + 1, 0)
+            else:
+                x = v.get(k - 1, 0) + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                end_d = d
+                break
+        if end_d >= 0:
+            break
+
+    # Backtrack through the stored traces to recover the edit script.
+    script: List[tuple[str, int, int]] = []
+    x, y = n, m
+    for d in range(end_d, 0, -1):
+        prev_v = trace[d]
+        k = x - y
+        if k == -d or (k != d and prev_v.get(k - 1, -1) < prev_v.get(k + 1, -1)):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = prev_v[prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            script.append(("equal", x - 1, y - 1))
+            x -= 1
+            y -= 1
+        if x == prev_x:
+            script.append(("insert", x, y - 1))
+        else:
+            script.append(("delete", x - 1, y))
+        x, y = prev_x, prev_y
+    while x > 0 and y > 0:
+        script.append(("equal", x - 1, y - 1))
+        x -= 1
+        y -= 1
+
+    # Collapse per-element steps into SequenceMatcher-style opcode runs,
+    # merging adjacent delete/insert runs into a single replace.
+    opcodes: List[List] = []
+    i = j = 0
+    for tag, _, _ in reversed(script):
+        if tag == "equal":
+            i2, j2 = i + 1, j + 1
+        elif tag == "delete":
+            i2, j2 = i + 1, j
+        else:
+            i2, j2 = i, j + 1
+        is_equal = tag == "equal"
+        if opcodes and (opcodes[-1][0] == "equal") == is_equal:
+            opcodes[-1][2] = i2
+            opcodes[-1][4] = j2
+        else:
+            opcodes.append(["equal" if is_equal else "replace", i, i2, j, j2])
+        i, j = i2, j2
+
+    result: List[tuple[str, int, int, int, int]] = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag != "equal":
+            if i1 == i2:
+                tag = "insert"
+            elif j1 == j2:
+                tag = "delete"
+        result.append((tag, i1, i2, j1, j2))
+    return result
+
+
+def _diff_opcodes(a: List[str], b: List[str]) -> List[tuple[str, int, int, int, int]]:
+    """Diff two token sequences with the fastest available backend.
+
+    Prefers rapidfuzz's C++ Levenshtein opcodes, then the pure-Python Myers
+    diff, then SequenceMatcher when Myers exceeds its effort budget. All three
+    emit the same ``(tag, i1, i2, j1, j2)`` tuples.
+    """
+    if _RapidfuzzLevenshtein is not None:
+        return [
+            (op.tag, op.src_start, op.src_end, op.dest_start, op.dest_end)
+            for op in _RapidfuzzLevenshtein.opcodes(a, b)
+        ]
+    opcodes = _myers_opcodes(a, b)
+    if opcodes is not None:
+        return opcodes
+    matcher = SequenceMatcher(None, a, b, autojunk=False)
+    return matcher.get_opcodes()
+
+
+# Mismatched spans longer than this fall back to uniform time distribution;
+# the O(tokens * words) scoring pass is only worthwhile on short runs.
+BPM_SPAN_LIMIT = 16
+
+
+def _bpm_edit_distance(pattern: str, text: str) -> int:
+    """Levenshtein distance via Myers' bit-parallel (BPM) algorithm.
+
+    Runs in O(len(text)) word operations for patterns up to 64 characters,
+    which covers every normalized token this module produces.
+    """
+    m = len(pattern)
+    if m == 0:
+        return len(text)
+    if not text:
+        return m
+    if m > 64 and len(text) <= 64:
+        # Distance is symmetric; keep the bitvector within one machine word.
+        pattern, text, m = text, pattern, len(text)
+    if m > 64:
+        # Degenerate case for this module; plain DP keeps it correct.
+        previous = list(range(len(text) + 1))
+        for i, pc in enumerate(pattern, start=1):
+            current = [i]
+            for j, tc in enumerate(text, start=1):
+                current.append(min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (pc != tc),
+                ))
+            previous = current
+        return previous[-1]
+
+    peq: Dict[str, int] = {}
+    for idx, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << idx)
+
+    mask = (1 << m) - 1
+    high_bit = 1 << (m - 1)
+    pv = mask
+    mv = 0
+    score = m
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) & mask) ^ pv | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high_bit:
+            score += 1
+        elif mh & high_bit:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = (mh | (~(xv | ph) & mask)) & mask
+        mv = ph & xv
+    return score
+
+
+def _assign_span_by_similarity(
+    token_entries: List[tuple[int, str]],
+    word_norms: List[str],
+    word_starts: np.ndarray,
+    word_ends: np.ndarray,
+    assignments: Dict[int, Timing],
+) -> bool:
+    """Assign words to tokens in a mismatched span by edit-distance scoring.
+
+    Tokens and words are both in reading order, so a left-to-right greedy
+    with a monotonically advancing word cursor keeps assignments ordered.
+    Returns ``False`` when the span is too large (or one side is empty) so
+    the caller can fall back to uniform distribution.
+    """
+    if not token_entries or not word_norms:
+        return False
+    if len(token_entries) > BPM_SPAN_LIMIT or len(word_norms) > BPM_SPAN_LIMIT:
+        return False
+
+    cursor = 0
+    for token_index, normalized in token_entries:
+        best_idx = cursor
+        best_score = None
+        for word_idx in range(cursor, len(word_norms)):
+            word_norm = word_norms[word_idx]
+            distance = _bpm_edit_distance(normalized, word_norm)
+            score = distance / max(len(normalized), len(word_norm), 1)
+            if best_score is None or score < best_score:
+                best_score = score
+                best_idx = word_idx
+        assignments[token_index] = Timing(
+            float(word_starts[best_idx]), float(word_ends[best_idx])
+        )
+        cursor = best_idx
+    return True
 
 
 def _assign_span(
     token_entries: List[tuple[int, str]],
-    word_entries: List[Dict[str, float]],
-    assignments: Dict[int, Dict[str, float]],
+    word_starts: np.ndarray,
+    word_ends: np.ndarray,
+    assignments: Dict[int, Timing],
 ) -> None:
-    if not token_entries or not word_entries:
+    if not token_entries or word_starts.size == 0:
         return
 
-    span_start = word_entries[0]["start"]
-    span_end = word_entries[-1]["end"]
-    span_end = max(span_start, span_end)
+    span_start = float(word_starts[0])
+    span_end = max(span_start, float(word_ends[-1]))
     span_duration = max(0.0, span_end - span_start)
 
     count = len(token_entries)
-    for idx, (token_index, _) in enumerate(token_entries):
-        if span_duration == 0.0:
-            token_start = span_start
-            token_end = span_end
-        else:
-            frac_start = idx / count
-            frac_end = (idx + 1) / count
-            token_start = span_start + span_duration * frac_start
-            token_end = span_start + span_duration * frac_end
-        assignments[token_index] = {
-            "start": token_start,
-            "end": max(token_start, token_end),
-        }
+    if span_duration == 0.0:
+        for token_index, _ in token_entries:
+            assignments[token_index] = Timing(span_start, span_end)
+        return
+
+    # All arithmetic happens vectorized: fraction edges in one expression and
+    # the start/end clamp as an elementwise maximum. tolist() converts every
+    # value to Python floats in a single C pass, leaving only the dict writes
+    # in the loop.
+    edges = span_start + span_duration * np.arange(count + 1) / count
+    token_starts = edges[:-1]
+    token_ends = np.maximum(token_starts, edges[1:])
+    for (token_index, _), start, end in zip(
+        token_entries, token_starts.tolist(), token_ends.tolist()
+    ):
+        assignments[token_index] = Timing(start, end)
 
 
 def _map_words_to_tokens(
     tokens: List[Dict[str, object]],
     words: List[Dict[str, float]],
-) -> List[Optional[Dict[str, float]]]:
+) -> List[Optional[Timing]]:
     token_word_entries: List[tuple[int, str]] = []
+    has_word_char = _WORD_CHAR_RE.search
     for idx, token in enumerate(tokens):
-        value = str(token.get("value", ""))
-        if re.search(r"\w", value):
-            normalized = _normalize_token(value)
-            if normalized:
-                token_word_entries.append((idx, normalized))
+        # Cache normalization on the token dict ("_norm"/"_has_word") so
+        # repeated alignment passes (e.g. backend retries) skip the regex work.
+        normalized = token.get("_norm")
+        if normalized is None:
+            value = str(token.get("value", ""))
+            has_word = has_word_char(value) is not None
+            # Interned strings let the diff backends compare by pointer
+            # instead of memcmp, and chapters repeat words heavily.
+            normalized = sys.intern(_normalize_token(value)) if has_word else ""
+            token["_norm"] = normalized
+            token["_has_word"] = has_word
+        if normalized:
+            token_word_entries.append((idx, normalized))
 
-    whisper_entries: List[tuple[str, Dict[str, float]]] = []
+    # Struct-of-arrays word storage: the norm list feeds the diff and the
+    # float arrays replace per-word dict lookups in the span assignment.
+    word_norms: List[str] = []
+    word_start_list: List[float] = []
+    word_end_list: List[float] = []
     for word in words:
-        normalized = _normalize_token(word["text"])
+        normalized = word.get("_norm")
+        if normalized is None:
+            normalized = sys.intern(_normalize_token(word["text"]))
         if normalized:
-            whisper_entries.append((normalized, word))
+            word_norms.append(normalized)
+            word_start_list.append(word["start"])
+            word_end_list.append(word["end"])
 
-    if not token_word_entries or not whisper_entries:
+    if not token_word_entries or not word_norms:
         return [None] * len(tokens)
 
-    matcher = SequenceMatcher(
-        None,
-        [entry[1] for entry in token_word_entries],
-        [entry[0] for entry in whisper_entries],
-        autojunk=False,
-    )
-
-    assignments: Dict[int, Dict[str, float]] = {}
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    word_starts = np.asarray(word_start_list, dtype=np.float64)
+    word_ends = np.asarray(word_end_list, dtype=np.float64)
+
+    token_norms = [entry[1] for entry in token_word_entries]
+    if token_norms == word_norms:
+        # Clean TTS audio re-aligned against its own script usually matches
+        # word-for-word; one interned-list comparison replaces the whole diff.
+        opcodes = [("equal", 0, len(token_norms), 0, len(word_norms))]
+    elif (
+        abs(len(token_norms) - len(word_norms))
+        / max(len(token_norms), len(word_norms))
+        > 0.5
+    ):
+        # Wildly different lengths mean the transcript is unusable for a
+        # fine-grained diff; distribute the span instead of paying for one.
+        opcodes = [("replace", 0, len(token_norms), 0, len(word_norms))]
+    else:
+        opcodes = _diff_opcodes(token_norms, word_norms)
+
+    assignments: Dict[int, Timing] = {}
+    for tag, i1, i2, j1, j2 in opcodes:
         if tag == "equal":
             for offset in range(i2 - i1):
                 token_index = token_word_entries[i1 + offset][0]
-                word_info = whisper_entries[j1 + offset][1]
-                assignments[token_index] = {
-                    "start": word_info["start"],
-                    "end": word_info["end"],
-                }
+                assignments[token_index] = Timing(
+                    float(word_starts[j1 + offset]),
+                    float(word_ends[j1 + offset]),
+                )
         else:
             token_slice = token_word_entries[i1:i2]
-            word_slice = [entry[1] for entry in whisper_entries[j1:j2]]
-            _assign_span(token_slice, word_slice, assignments)
+            if not _assign_span_by_similarity(
+                token_slice,
+                word_norms[j1:j2],
+                word_starts[j1:j2],
+                word_ends[j1:j2],
+                assignments,
+            ):
+                _assign_span(
+                    token_slice,
+                    word_starts[j1:j2],
+                    word_ends[j1:j2],
+                    assignments,
+                )
+
+    # Monotonicity pass as a prefix-max: the carried last_end equals the
+    # running maximum of max(start, end) over assigned tokens (floored at 0),
+    # so np.maximum.accumulate replaces the serial Python loop.
+    n = len(tokens)
+    starts = np.full(n, -np.inf)
+    ends = np.full(n, -np.inf)
+    for idx, aligned in assignments.items():
+        starts[idx] = aligned.start
+        ends[idx] = aligned.end
+
+    running_end = np.maximum(np.maximum.accumulate(np.maximum(starts, ends)), 0.0)
+    previous_end = np.concatenate(([0.0], running_end[:-1]))
+    final_starts = np.maximum(starts, previous_end)
+
+    return [
+        Timing(float(final_starts[idx]), float(running_end[idx]))
+        if idx in assignments
+        else None
+        for idx in range(n)
+    ]
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_compute_type(device: str) -> str:
+    """Pick the CTranslate2 compute type for faster-whisper.
+
+    Alignment only uses the transcript to place timestamps — the shipped text
+    comes from the EPUB — so precision lost to int8 weights is invisible and
+    the fastest quantized kernel the hardware supports wins. Preference order
+    on CUDA is int8_bfloat16, then int8_float16, then float16; on CPU, int8.
+    ``ALIGNMENT_COMPUTE_TYPE`` overrides, and anything unprobeable falls back
+    to ``"auto"`` so the runtime picks a kernel that actually exists.
+    """
+    requested = os.environ.get("ALIGNMENT_COMPUTE_TYPE")
+    if requested:
+        return requested
+    try:  # pragma: no cover - optional dependency
+        import ctranslate2
+    except ImportError:  # pragma: no cover - optional dependency
+        return "auto"
+    ct2_device = "cuda" if device.startswith("cuda") else "cpu"
+    try:
+        _, _, index = device.partition(":")
+        device_index = int(index) if index else 0
+        supported = set(
+            ctranslate2.get_supported_compute_types(ct2_device, device_index)
+        )
+    except (RuntimeError, ValueError):
+        return "auto"
+    if ct2_device == "cuda":
+        preferences = ("int8_bfloat16", "int8_float16", "float16")
+    else:
+        preferences = ("int8",)
+    for compute_type in preferences:
+        if compute_type in supported:
+            return compute_type
+    return "auto"
+
+
+def _transcribe_with_faster_whisper(
+    audio,
+    model_id: str,
+    device: str,
+    language_hint: Optional[str],
+    beam_size: Optional[int] = None,
+) -> Optional[Dict[str, object]]:
+    """Transcribe with faster-whisper using reduced-precision compute.
+
+    ``audio`` is a file path or an in-memory 16 kHz float32 buffer. Returns a
+    whisperx-compatible ``{"segments": [...], "language": ...}`` payload, or
+    ``None`` when faster-whisper is unavailable so the caller can fall back to
+    whisperx's own transcription.
+    """
+    try:  # pragma: no cover - optional dependency
+        from faster_whisper import WhisperModel
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    try:  # pragma: no cover - optional dependency
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:  # pragma: no cover - older faster-whisper
+        BatchedInferencePipeline = None
+
+    compute_type = _resolve_compute_type(device)
+    cache_key = ("faster-whisper", model_id, device)
+    with _MODEL_CACHE_LOCK:
+        model = _ASR_CACHE.get(cache_key)
+        if model is None:
+            try:
+                model = WhisperModel(model_id, device=device, compute_type=compute_type)
+            except ValueError as exc:
+                # CTranslate2 raises when the requested compute type has no
+                # kernel on this hardware; retry with a safe default.
+                fallback = "float16" if device.startswith("cuda") else "int8"
+                logger.warning(
+                    "compute_type '%s' unsupported (%s); falling back to '%s'",
+                    compute_type,
+                    exc,
+                    fallback,
+                )
+                model = WhisperModel(model_id, device=device, compute_type=fallback)
+            if BatchedInferencePipeline is not None:
+                # Batched decode VAD-chunks the audio and feeds chunks to the
+                # GPU in parallel instead of decoding the file sequentially;
+                # on long chapters this saturates the GPU the same way
+                # whisperx's batched pipeline does.
+                model = BatchedInferencePipeline(model=model)
+            _ASR_CACHE[cache_key] = model
+    transcribe_kwargs: Dict[str, object] = {}
+    if BatchedInferencePipeline is not None:
+        transcribe_kwargs["batch_size"] = FASTER_WHISPER_BATCH_SIZE
+    # Greedy decode: alignment only needs roughly-correct words (the diff in
+    # _map_words_to_tokens tolerates transcription errors), so beam search
+    # buys nothing at 3-5x the decode cost.
+    segments, info = model.transcribe(
+        audio,
+        beam_size=beam_size or 1,
+        temperature=0.0,
+        condition_on_previous_text=False,
+        # Word timings come from whisperx.align downstream; skipping them here
+        # avoids the per-word DTW pass and the word tuples each segment object
+        # would otherwise carry.
+        word_timestamps=False,
+        vad_filter=True,
+        vad_parameters={"min_silence_duration_ms": 500},
+        language=language_hint,
+        **transcribe_kwargs,
+    )
+    # ``segments`` is a generator that yields as decoding proceeds; the single
+    # comprehension drains it in one streaming pass with no intermediate list.
+    segment_dicts = [
+        {"text": segment.text, "start": segment.start, "end": segment.end}
+        for segment in segments
+    ]
+    return {"segments": segment_dicts, "language": info.language}
+
+
+def _run_whisperx_align(
+    whisperx,
+    segments: List[Dict[str, object]],
+    align_model,
+    metadata,
+    audio,
+    device: str,
+) -> Dict[str, object]:
+    """Run whisperx.align over segment batches on a thread pool.
+
+    The Viterbi backtracking inside whisperx.align is CPU-bound and releases
+    the GIL inside torch ops, so aligning segment batches concurrently lets
+    the CPU decode one batch while the GPU computes emissions for the next.
+    ``executor.map`` preserves batch order, so segments come back in sequence.
+    """
+    workers = min(os.cpu_count() or 1, len(segments))
+    if workers <= 1 or len(segments) <= 1:
+        return whisperx.align(
+            segments,
+            align_model,
+            metadata,
+            audio,
+            device=device,
+            return_char_alignments=False,
+        )
 
-    results: List[Optional[Dict[str, float]]] = [None] * len(tokens)
-    last_end = 0.0
-    for idx in range(len(tokens)):
-        aligned = assignments.get(idx)
-        if not aligned:
-            results[idx] = None
-            continue
-        start = max(last_end, aligned["start"])
-        end = max(start, aligned["end"])
-        results[idx] = {"start": start, "end": end}
-        last_end = end
+    # Contiguous batches keep segments in reading order after the merge.
+    step = -(-len(segments) // workers)
+    batches = [segments[i:i + step] for i in range(0, len(segments), step)]
 
-    return results
+    def _align_batch(batch):
+        return whisperx.align(
+            batch,
+            align_model,
+            metadata,
+            audio,
+            device=device,
+            return_char_alignments=False,
+        )
+
+    merged: List[Dict[str, object]] = []
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        for part in executor.map(_align_batch, batches):
+            merged.extend(part.get("segments", []))
+    return {"segments": merged}
 
 
 def _align_with_whisperx(
@@ -141,7 +694,10 @@ def _align_with_whisperx(
     device: Optional[str],
     model_name: Optional[str],
     batch_size: Optional[int],
-) -> Optional[List[Optional[Dict[str, float]]]]:
+    beam_size: Optional[int] = None,
+    audio_data: Optional[np.ndarray] = None,
+    sample_rate: Optional[int] = None,
+) -> Optional[List[Optional[Timing]]]:
     try:  # pragma: no cover - optional dependency
         import whisperx
     except ImportError:  # pragma: no cover - optional dependency
@@ -152,25 +708,54 @@ def _align_with_whisperx(
     model_id = model_name or "large-v2"
     language_hint = _normalize_language(language)
 
-    try:
-        asr_model = whisperx.load_model(model_id, device=resolved_device)
-        result = asr_model.transcribe(
-            audio_path,
-            batch_size=batch_size or 16,
-            language=language_hint,
+    # When the caller still holds the waveform it just synthesized, align
+    # against that buffer instead of decoding the file all over again.
+    if audio_data is not None:
+        audio_input = _resample_for_whisper(
+            audio_data, sample_rate or WHISPER_SAMPLE_RATE
         )
+    else:
+        audio_input = audio_path
+
+    try:
+        cache_key = _transcript_cache_key(audio_path, model_id, resolved_device)
+        result = _transcript_cache_get(cache_key)
+        if result is None:
+            result = _transcribe_with_faster_whisper(
+                audio_input, model_id, resolved_device, language_hint, beam_size
+            )
+        if result is None:
+            asr_key = ("whisperx", model_id, resolved_device)
+            with _MODEL_CACHE_LOCK:
+                asr_model = _ASR_CACHE.get(asr_key)
+                if asr_model is None:
+                    asr_model = whisperx.load_model(model_id, device=resolved_device)
+                    _ASR_CACHE[asr_key] = asr_model
+            result = asr_model.transcribe(
+                audio_input,
+                batch_size=batch_size or 16,
+                language=language_hint,
+            )
+        if cache_key is not None and result is not None:
+            _transcript_cache_put(cache_key, result)
         detected_language = result.get("language") or language_hint or "en"
-        align_model, metadata = whisperx.load_align_model(
-            language=detected_language,
-            device=resolved_device,
-        )
-        aligned = whisperx.align(
+        align_key = (detected_language, resolved_device)
+        with _MODEL_CACHE_LOCK:
+            cached_align = _ALIGN_CACHE.get(align_key)
+            if cached_align is None:
+                cached_align = whisperx.load_align_model(
+                    language=detected_language,
+                    device=resolved_device,
+                )
+                _ALIGN_CACHE[align_key] = cached_align
+        align_model, metadata = cached_align
+        aligned = _run_whisperx_align(
+            whisperx,
             result["segments"],
             align_model,
             metadata,
-            audio_path,
-            device=resolved_device,
-            return_char_alignments=False,
+            audio_input,
+            resolved_device,
         )
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.warning("WhisperX alignment failed: %s", exc)
@@ -188,6 +773,9 @@ def _align_with_whisperx(
                 continue
             words.append({
                 "text": text,
+                # Normalize here while the string is hot instead of paying a
+                # second pass over the corpus in _map_words_to_tokens.
+                "_norm": sys.intern(_normalize_token(text)),
                 "start": float(start),
                 "end": float(end),
             })
@@ -205,7 +793,7 @@ def _align_with_nemo(
     language: Optional[str],
     device: Optional[str],
     model_name: Optional[str],
-) -> Optional[List[Optional[Dict[str, float]]]]:
+) -> Optional[List[Optional[Timing]]]:
     try:  # pragma: no cover - optional dependency
         import nemo.collections.asr as nemo_asr
     except ImportError:  # pragma: no cover - optional dependency
@@ -225,7 +813,7 @@ def _align_with_torchaudio(
     language: Optional[str],
     device: Optional[str],
     model_name: Optional[str],
-) -> Optional[List[Optional[Dict[str, float]]]]:
+) -> Optional[List[Optional[Timing]]]:
     try:  # pragma: no cover - optional dependency
         import torchaudio  # noqa: F401
     except ImportError:  # pragma: no cover - optional dependency
@@ -239,6 +827,72 @@ def _align_with_torchaudio(
     return None
 
 
+def align_tokens_with_audio_batch(
+    items: Iterable[tuple[str, Iterable[Dict[str, object]]]],
+    language: Optional[str],
+    *,
+    backend: Optional[str] = None,
+    device: Optional[str] = None,
+    model_name: Optional[str] = None,
+    batch_size: Optional[int] = None,
+) -> List[Optional[List[Optional[Timing]]]]:
+    """Align several ``(audio_path, tokens)`` pairs with one model load.
+
+    The ASR and alignment models are loaded once (via the module caches) and
+    shared by every item, and items run concurrently on a small thread pool:
+    CTranslate2 releases the GIL during decode, so the CPU-side normalize/diff
+    work for one chapter overlaps with GPU inference for the next. Results are
+    returned in input order, one entry per item, each shaped like the return
+    value of :func:`align_tokens_with_audio`.
+    """
+    item_list = list(items)
+    if not item_list:
+        return []
+
+    def _align_item(item):
+        audio_path, tokens = item
+        return align_tokens_with_audio(
+            audio_path,
+            tokens,
+            language,
+            backend=backend,
+            device=device,
+            model_name=model_name,
+            batch_size=batch_size,
+        )
+
+    workers = min(4, os.cpu_count() or 1, len(item_list))
+    if workers <= 1:
+        return [_align_item(item) for item in item_list]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_align_item, item_list))
+
+
+def release_alignment_models() -> None:
+    """Drop cached ASR/alignment models and free any CUDA memory they held."""
+    with _MODEL_CACHE_LOCK:
+        released_align = list(_ALIGN_CACHE.values())
+        _ASR_CACHE.clear()
+        _ALIGN_CACHE.clear()
+    _TRANSCRIPT_CACHE.clear()
+    # Move torch align models off the GPU before the references die so their
+    # buffers are actually returned to the allocator.
+    for model, _metadata in released_align:
+        cpu = getattr(model, "cpu", None)
+        if callable(cpu):
+            try:
+                cpu()
+            except Exception:  # pragma: no cover - defensive cleanup
+                pass
+    try:  # pragma: no cover - torch is optional at runtime
+        import torch
+
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except Exception:  # pragma: no cover - optional dependency
+        pass
+
+
 def align_tokens_with_audio(
     audio_path: str,
     tokens: Iterable[Dict[str, object]],
@@ -248,11 +902,16 @@ def align_tokens_with_audio(
     device: Optional[str] = None,
     model_name: Optional[str] = None,
     batch_size: Optional[int] = None,
-) -> Optional[List[Optional[Dict[str, float]]]]:
+    beam_size: Optional[int] = None,
+    audio: Optional[np.ndarray] = None,
+    sample_rate: Optional[int] = None,
+) -> Optional[List[Optional[Timing]]]:
     """Align chapter tokens to audio using the requested backend.
 
-    Returns a list matching ``tokens`` containing dictionaries with ``start``/``end``
-    (seconds). ``None`` is returned when alignment fails for every token.
+    Returns a list matching ``tokens`` containing :class:`Timing` entries with
+    ``start``/``end`` (seconds). ``None`` is returned when alignment fails for
+    every token. Callers that still hold the waveform in memory can pass it
+    via ``audio``/``sample_rate`` to skip re-decoding ``audio_path``.
     """
 
     token_list = list(tokens)
@@ -265,7 +924,17 @@ def align_tokens_with_audio(
         return None
 
     if backend_key == "whisperx":
-        return _align_with_whisperx(audio_path, token_list, language, device, model_name, batch_size)
+        return _align_with_whisperx(
+            audio_path,
+            token_list,
+            language,
+            device,
+            model_name,
+            batch_size,
+            beam_size,
+            audio_data=audio,
+            sample_rate=sample_rate,
+        )
 
     if backend_key == "nemo":
         return _align_with_nemo(audio_path, token_list, language, device, model_name)
@@ -276,4 +945,10 @@ def align_tokens_with_audio(
     return None
 
 
-__all__ = ["align_tokens_with_audio", "SUPPORTED_ALIGNERS"]
+__all__ = [
+    "Timing",
+    "align_tokens_with_audio",
+    "align_tokens_with_audio_batch",
+    "release_alignment_models",
+    "SUPPORTED_ALIGNERS",
+]
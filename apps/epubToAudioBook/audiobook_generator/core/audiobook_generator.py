@@ -2,9 +2,17 @@ import json
 import logging
 import multiprocessing
 import os
+import sys
 import time
+from logging.handlers import QueueListener
+from multiprocessing import shared_memory
 from tqdm import tqdm
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from audiobook_generator.book_parsers.base_book_parser import get_book_parser
 from audiobook_generator.config.general_config import GeneralConfig
 from audiobook_generator.core.audio_tags import AudioTags
@@ -16,10 +24,25 @@ logger = logging.getLogger(__name__)
 # Global variable to hold the TTS provider instance in each worker process
 tts_provider = None
 
-def init_worker(config, log_level, log_file, is_worker):
+# Shared-memory arena holding every chapter text; attached once per worker so
+# tasks only carry (offset, length) instead of re-pickling megabytes of UTF-8
+# per dispatch under spawn.
+_text_arena = None
+
+def init_worker(config, log_level, log_file, is_worker, text_arena_name=None, log_queue=None):
     """Initializer for the worker process."""
-    global tts_provider
-    setup_logging(log_level, log_file, is_worker)
+    global tts_provider, _text_arena
+    setup_logging(log_level, log_file, is_worker, queue=log_queue)
+    if text_arena_name is not None:
+        _text_arena = shared_memory.SharedMemory(name=text_arena_name)
+        try:
+            # Attaching registers the segment with this process's resource
+            # tracker, which would try to clean up what the parent owns;
+            # only the parent unlinks.
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(_text_arena._name, "shared_memory")
+        except Exception:
+            pass
     if getattr(config, "kokoro_devices", None):
         identity = multiprocessing.current_process()._identity
         worker_idx = identity[0] - 1 if identity else 0
@@ -28,6 +51,39 @@ def init_worker(config, log_level, log_file, is_worker):
             assigned = devices[worker_idx % len(devices)]
             config.device = assigned
     tts_provider = get_tts_provider(config)
+    # Load model weights now rather than lazily on the first task, so startup
+    # cost overlaps with the parent's task preparation instead of delaying the
+    # first chapter.
+    if not getattr(config, "preview", False) and hasattr(tts_provider, "get_tts_model"):
+        tts_provider.get_tts_model()
+
+
+def _select_mp_context(config):
+    """Pick the multiprocessing start method for the worker pool.
+
+    CUDA-enabled Kokoro jobs must use 'spawn': a forked child inherits the
+    parent's CUDA state and crashes on first kernel launch. Everything else
+    uses 'forkserver' where available so workers start from a clean helper
+    process instead of a full copy of the parent. The parent never imports
+    torch/kokoro at module scope (get_tts_model is lazy), so it holds no CUDA
+    context before workers start.
+    """
+    if (
+        getattr(config, "tts", None) == "kokoro"
+        and isinstance(getattr(config, "device", None), str)
+        and config.device.startswith("cuda")
+    ):
+        logger.debug("Using 'spawn' multiprocessing context for CUDA-enabled Kokoro jobs.")
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context(
+        "forkserver" if sys.platform != "win32" else "spawn"
+    )
+    if context.get_start_method() == "forkserver" and getattr(config, "tts", None) == "kokoro":
+        # Import the heavy modules once in the forkserver helper; every worker
+        # then forks with them already loaded instead of re-importing ~seconds
+        # of torch per process.
+        context.set_forkserver_preload(["numpy", "soundfile", "torch", "kokoro_tts"])
+    return context
 
 
 def confirm_conversion():
@@ -52,7 +108,7 @@ class AudiobookGenerator:
     def __str__(self) -> str:
         return f"{self.config}"
 
-    def process_chapter(self, idx, title, text, book_title, book_author):
+    def process_chapter(self, idx, title, text, book_title, book_author, text_file, output_file):
         """Process a single chapter: write text (if needed) and convert to audio."""
         try:
             logger.info(f"Processing chapter {idx}: {title}")
@@ -62,7 +118,6 @@ class AudiobookGenerator:
 
             # Save chapter text if required
             if self.config.output_text:
-                text_file = os.path.join(self.config.output_folder, f"{idx:04d}_{title}.txt")
                 logger.debug(f"Writing chapter text to {text_file}")
                 with open(text_file, "w", encoding="utf-8") as f:
                     f.write(text)
@@ -71,11 +126,6 @@ class AudiobookGenerator:
             if self.config.preview:
                 return True
 
-            # Generate audio file
-            output_file = os.path.join(
-                self.config.output_folder,
-                f"{idx:04d}_{title}.{tts_provider.get_output_file_extension()}",
-            )
             logger.debug(f"Output audio file: {output_file}")
 
             audio_tags = AudioTags(
@@ -94,8 +144,11 @@ class AudiobookGenerator:
 
     def process_chapter_wrapper(self, args):
         """Wrapper for process_chapter to handle unpacking args for imap."""
-        idx, title, text, book_title, book_author = args
-        return idx, self.process_chapter(idx, title, text, book_title, book_author)
+        idx, title, offset, length, book_title, book_author, text_file, output_file = args
+        text = bytes(_text_arena.buf[offset:offset + length]).decode("utf-8")
+        return idx, self.process_chapter(
+            idx, title, text, book_title, book_author, text_file, output_file
+        )
 
     def run(self):
         if self.config.verbose:
@@ -153,51 +206,99 @@ class AudiobookGenerator:
             chapters_to_process = chapters[self.config.chapter_start - 1 : self.config.chapter_end]
             book_title = book_parser.get_book_title()
             book_author = book_parser.get_book_author()
-            tasks = [
-                (idx, title, text, book_title, book_author)
-                for idx, (title, text) in enumerate(
-                    chapters_to_process, start=self.config.chapter_start
+            # All chapter texts live in one shared-memory arena; tasks carry
+            # only (offset, length) so dispatch never re-pickles the text.
+            encoded_texts = [text.encode("utf-8") for _, text in chapters_to_process]
+            text_arena = shared_memory.SharedMemory(
+                create=True, size=max(1, sum(len(encoded) for encoded in encoded_texts))
+            )
+            # Precompute per-chapter output paths once in the parent; the
+            # extension never changes and workers then skip the path joins.
+            audio_extension = main_tts_provider.get_output_file_extension()
+            tasks = []
+            offset = 0
+            for idx, ((title, _), encoded) in enumerate(
+                zip(chapters_to_process, encoded_texts), start=self.config.chapter_start
+            ):
+                text_arena.buf[offset:offset + len(encoded)] = encoded
+                base_path = os.path.join(self.config.output_folder, f"{idx:04d}_{title}")
+                tasks.append(
+                    (
+                        idx,
+                        title,
+                        offset,
+                        len(encoded),
+                        book_title,
+                        book_author,
+                        f"{base_path}.txt",
+                        f"{base_path}.{audio_extension}",
+                    )
                 )
-            ]
+                offset += len(encoded)
+            del encoded_texts
 
             # Track failed chapters
             failed_chapters = []
 
             # Use multiprocessing to process chapters in parallel
-            mp_context = multiprocessing
-            if (
-                getattr(self.config, "tts", None) == "kokoro"
-                and isinstance(getattr(self.config, "device", None), str)
-                and self.config.device.startswith("cuda")
-            ):
-                try:
-                    mp_context = multiprocessing.get_context("spawn")
-                    logger.debug(
-                        "Using 'spawn' multiprocessing context for CUDA-enabled Kokoro jobs."
-                    )
-                except ValueError:
-                    logger.warning(
-                        "Failed to switch multiprocessing context to 'spawn'; continuing with default."
-                    )
-
-            with mp_context.Pool(
-                processes=self.config.worker_count,
-                initializer=init_worker,
-                initargs=(self.config, self.config.log, self.config.log_file, True),
-            ) as pool:
-                # Process chapters and collect results
-                results = []
-                for idx, success in tqdm(
-                    pool.imap_unordered(self.process_chapter_wrapper, tasks),
-                    total=len(tasks),
-                    desc="Converting chapters"
-                ):
-                    results.append((idx, success))
-                # Check for failed chapters
-                for idx, success in results:
-                    if not success:
-                        chapter_title = chapters_to_process[idx - self.config.chapter_start][0]
-                        failed_chapters.append((idx, chapter_title))
+            mp_context = _select_mp_context(self.config)
+
+            # Workers log through a queue drained by one parent-side listener,
+            # so only this process appends to the console/log file.
+            log_listener = None
+            log_manager = None
+            log_queue = None
+            parent_handlers = logging.getLogger().handlers
+            if parent_handlers:
+                log_manager = mp_context.Manager()
+                log_queue = log_manager.Queue(-1)
+                log_listener = QueueListener(
+                    log_queue, *parent_handlers, respect_handler_level=True
+                )
+                log_listener.start()
+
+            try:
+                with mp_context.Pool(
+                    processes=self.config.worker_count,
+                    initializer=init_worker,
+                    initargs=(
+                        self.config,
+                        self.config.log,
+                        self.config.log_file,
+                        True,
+                        text_arena.name,
+                        log_queue,
+                    ),
+                ) as pool:
+                    # Batching tasks amortizes the pickle/IPC round-trip per
+                    # dispatch, but only pays off when chapters are short and
+                    # plentiful; long chapters batched together would leave
+                    # workers idle at the tail, so those stay at chunksize=1.
+                    total_characters = sum(task[3] for task in tasks)
+                    mean_len = total_characters / len(tasks) if tasks else 0
+                    if mean_len < 2000 and len(tasks) > 4 * self.config.worker_count:
+                        chunksize = max(1, len(tasks) // (self.config.worker_count * 4))
+                    else:
+                        chunksize = 1
+                    logger.info(f"Dispatching {len(tasks)} chapters with chunksize={chunksize}")
+                    # Process chapters and record outcomes as they stream in
+                    success_map = {}
+                    for idx, success in tqdm(
+                        pool.imap_unordered(self.process_chapter_wrapper, tasks, chunksize=chunksize),
+                        total=len(tasks),
+                        desc="Converting chapters"
+                    ):
+                        success_map[idx] = success
+                        if not success:
+                            chapter_title = chapters_to_process[idx - self.config.chapter_start][0]
+                            failed_chapters.append((idx, chapter_title))
+            finally:
+                text_arena.close()
+                text_arena.unlink()
+                if log_listener is not None:
+                    log_listener.stop()
+                if log_manager is not None:
+                    log_manager.shutdown()
 
             if failed_chapters:
                 logger.warning("The following chapters failed to convert:")
@@ -212,7 +313,7 @@ class AudiobookGenerator:
                 book_author,
                 main_tts_provider.get_output_file_extension(),
                 chapters_to_process,
-                results,
+                success_map,
             )
 
         except KeyboardInterrupt:
@@ -222,32 +323,55 @@ class AudiobookGenerator:
         finally:
             logger.debug("AudiobookGenerator.run() method finished.")
 
+    @staticmethod
+    def _read_chapter_duration_ms(metadata_path):
+        """Pull duration_ms from a chapter metadata file, None if unavailable.
+
+        Only providers that emit timestamp metadata write these files, so a
+        missing or unreadable one simply leaves the manifest entry without a
+        duration and packaging falls back to probing.
+        """
+        try:
+            with open(metadata_path, "rb") as metadata_file:
+                payload = metadata_file.read()
+            data = orjson.loads(payload) if orjson is not None else json.loads(payload)
+        except (OSError, ValueError):
+            return None
+        duration_ms = data.get("duration_ms") if isinstance(data, dict) else None
+        return duration_ms if isinstance(duration_ms, int) else None
+
     def _write_manifest(
         self,
         book_title: str,
         book_author: str,
         audio_extension: str,
         chapters_to_process,
-        results,
+        success_map,
     ) -> None:
         try:
-            os.makedirs(self.config.output_folder, exist_ok=True)
+            # run() already created the output folder before any work started.
             manifest_path = os.path.join(self.config.output_folder, "manifest.json")
 
-            success_map = {idx: success for idx, success in results}
             chapters_manifest = []
 
             for offset, (title, _) in enumerate(chapters_to_process, start=self.config.chapter_start):
                 base_name = f"{offset:04d}_{title}"
-                chapters_manifest.append(
-                    {
-                        "index": offset,
-                        "title": title,
-                        "audio": f"{base_name}.{audio_extension}",
-                        "metadata": f"{base_name}.json",
-                        "status": "ready" if success_map.get(offset, False) else "failed",
-                    }
-                )
+                entry = {
+                    "index": offset,
+                    "title": title,
+                    "audio": f"{base_name}.{audio_extension}",
+                    "metadata": f"{base_name}.json",
+                    "status": "ready" if success_map.get(offset, False) else "failed",
+                }
+                if entry["status"] == "ready":
+                    # Surface the exact duration the TTS stage recorded so
+                    # packaging never has to re-probe the audio file.
+                    duration_ms = self._read_chapter_duration_ms(
+                        os.path.join(self.config.output_folder, f"{base_name}.json")
+                    )
+                    if duration_ms is not None:
+                        entry["duration_ms"] = duration_ms
+                chapters_manifest.append(entry)
 
             payload = {
                 "book_id": os.path.basename(os.path.normpath(self.config.output_folder)),
@@ -257,8 +381,12 @@ class AudiobookGenerator:
                 "chapters": chapters_manifest,
             }
 
-            with open(manifest_path, "w", encoding="utf-8") as manifest_file:
-                json.dump(payload, manifest_file, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                with open(manifest_path, "wb") as manifest_file:
+                    manifest_file.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+            else:
+                with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+                    json.dump(payload, manifest_file, ensure_ascii=False, indent=2)
 
             logger.info("Book manifest written to %s", manifest_path)
         except Exception:
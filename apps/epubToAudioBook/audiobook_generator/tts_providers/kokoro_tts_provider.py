@@ -2,22 +2,43 @@ import json
 import logging
 import os
 import re
-import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List
 
 import numpy as np
 import soundfile as sf
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from audiobook_generator.core.audio_tags import AudioTags
 from audiobook_generator.core.alignment import align_tokens_with_audio
+from audiobook_generator.core._silence import silence_bounds, warm_up as warm_up_silence_kernel
 from audiobook_generator.tts_providers.base_tts_provider import BaseTTSProvider
-from audiobook_generator.utils.utils import split_text, set_audio_tags, pydub_merge_audio_segments
+from audiobook_generator.utils.utils import split_text, set_audio_tags
 
 logger = logging.getLogger(__name__)
 
-TOKEN_PATTERN = re.compile(r"[\w]+(?:['\-][\w]+)*|[^\s]", re.UNICODE)
+# Named groups classify each token in the same engine pass that matches it,
+# so weighting dispatches on match.lastgroup instead of running a second
+# regex per token. The pause class mirrors PAUSE_TOKENS.
+_TOKEN_REGEX = r"(?P<word>[\w]+(?:['\-][\w]+)*)|(?P<pause>[.!?;:])|(?P<punct>[^\s])"
+TOKEN_PATTERN = re.compile(_TOKEN_REGEX, re.UNICODE)
+# Same pattern with ASCII semantics for \w/\s: skips the per-codepoint
+# Unicode property lookups, which is most of the matching cost on plain
+# English chapters. Selected via str.isascii() (a C-level scan).
+TOKEN_PATTERN_ASCII = re.compile(_TOKEN_REGEX, re.ASCII)
 PAUSE_TOKENS = {".", "!", "?", ";", ":"}
 MIN_TOKEN_WEIGHT = 3
+# Pause weights never change, so resolve them with one dict probe instead of
+# a set test plus arithmetic per token.
+PAUSE_WEIGHTS = {
+    token: max(MIN_TOKEN_WEIGHT, len(token) + 8) for token in PAUSE_TOKENS
+}
+
+__all__ = ["KokoroTTSProvider"]
 
 
 class KokoroTTSProvider(BaseTTSProvider):
@@ -26,6 +47,9 @@ class KokoroTTSProvider(BaseTTSProvider):
         # kokoro tts specific initialization
         self.device = self.config.device or "cpu"
         self.tts_model = None
+        # Compile the numba silence kernel (when available) at construction
+        # time so per-chunk analysis never pays the JIT cost.
+        warm_up_silence_kernel()
 
     def validate_config(self):
         if not getattr(self.config, "voice_name", None):
@@ -53,36 +77,45 @@ class KokoroTTSProvider(BaseTTSProvider):
 
         chunk_records: List[Dict] = []
         all_tokens: List[Dict] = []
-        temp_files: List[str] = []
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            running_char_offset = 0
-
-            for i, chunk in enumerate(text_chunks):
-                chunk_id = f"chapter-{audio_tags.idx}_{audio_tags.title}_chunk_{i}_of_{len(text_chunks)}"
-                logger.info("Processing %s, length=%s", chunk_id, len(chunk))
-
-                temp_file = os.path.join(temp_dir, f"{i}.wav")
-                audio_stats = self._synthesize_speech(chunk, temp_file)
-
-                temp_files.append(temp_file)
-                chunk_records.append(
-                    {
-                        "text": chunk,
-                        "audio_path": temp_file,
-                        "duration": audio_stats["duration"],
-                        "leading_silence": audio_stats["leading_silence"],
-                        "trailing_silence": audio_stats["trailing_silence"],
-                        "char_offset": running_char_offset,
-                    }
-                )
+        # (start, end) indices into all_tokens per chunk, recorded here so the
+        # timing estimate can slice directly instead of re-deriving chunk
+        # boundaries from character offsets.
+        chunk_token_ranges: List[tuple] = []
+        sample_rate = self.get_tts_model().sample_rate
+        running_char_offset = 0
+
+        # One batched model call for every chunk in the chapter: the pipeline
+        # stays hot across chunk boundaries instead of being re-entered per
+        # chunk.
+        segments = self._synthesize_batch(text_chunks)
+
+        for i, (chunk, samples) in enumerate(zip(text_chunks, segments)):
+            chunk_id = f"chapter-{audio_tags.idx}_{audio_tags.title}_chunk_{i}_of_{len(text_chunks)}"
+            logger.info("Processing %s, length=%s", chunk_id, len(chunk))
+
+            audio_stats = self._analyze_audio_array(samples, sample_rate)
+            chunk_records.append(
+                {
+                    "text": chunk,
+                    "duration": audio_stats["duration"],
+                    "leading_silence": audio_stats["leading_silence"],
+                    "trailing_silence": audio_stats["trailing_silence"],
+                    "char_offset": running_char_offset,
+                }
+            )
 
-                tokens = list(self._tokenize(chunk, running_char_offset))
-                all_tokens.extend(tokens)
+            token_start = len(all_tokens)
+            all_tokens.extend(self._tokenize(chunk, running_char_offset))
+            chunk_token_ranges.append((token_start, len(all_tokens)))
 
-                running_char_offset += len(chunk)
+            running_char_offset += len(chunk)
 
-            pydub_merge_audio_segments(temp_files, output_file, self.get_output_file_extension())
+        # Chunks stay in memory until this single write: no temp WAVs, no
+        # pydub/ffmpeg re-decode of audio we just synthesized.
+        final = (
+            np.concatenate(segments) if segments else np.zeros(0, dtype=np.float32)
+        )
+        sf.write(output_file, final, sample_rate, subtype="PCM_16")
 
         try:
             set_audio_tags(output_file, audio_tags)
@@ -90,49 +123,69 @@ class KokoroTTSProvider(BaseTTSProvider):
             logger.warning("Skipping metadata tags for %s: %s", output_file, exc)
 
         if getattr(self.config, "emit_timestamps", True):
-            timings = self._build_precise_timings(output_file, chunk_records, all_tokens)
+            timings = self._build_precise_timings(
+                output_file,
+                chunk_records,
+                all_tokens,
+                final,
+                sample_rate,
+                chunk_token_ranges,
+            )
             total_duration_ms = int(sum(record["duration"] for record in chunk_records) * 1000)
             self._write_metadata(output_file, audio_tags, text, timings, total_duration_ms)
 
-    def _synthesize_speech(self, text: str, output_file: str) -> Dict[str, float]:
-        self.get_tts_model().synthesize(
-            text=text,
-            output_file=output_file,
-            voice=self.config.voice_name,
-            language="en",
-        )
-        return self._analyze_audio(output_file)
+    def _synthesize_batch(self, texts: List[str]) -> List[np.ndarray]:
+        model = self.get_tts_model()
+        if hasattr(model, "synthesize_batch"):
+            return model.synthesize_batch(
+                texts, voice=self.config.voice_name, language="en"
+            )
+
+        def synthesize(text: str) -> np.ndarray:
+            return model.synthesize_array(
+                text, voice=self.config.voice_name, language="en"
+            )
+
+        if self.device.startswith("cuda") and len(texts) > 1:
+            # Two-deep pipeline: torch releases the GIL inside forward, so the
+            # CPU-side phonemization of chunk N+1 overlaps GPU inference of
+            # chunk N. Results land by index to preserve chunk order.
+            segments: List[np.ndarray] = [None] * len(texts)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = {
+                    executor.submit(synthesize, text): i
+                    for i, text in enumerate(texts)
+                }
+                for future in as_completed(futures):
+                    segments[futures[future]] = future.result()
+            return segments
+        return [synthesize(text) for text in texts]
 
     def _analyze_audio(self, audio_path: str) -> Dict[str, float]:
-        with sf.SoundFile(audio_path) as audio_file:
-            sample_rate = audio_file.samplerate or 1
-            frames = audio_file.frames
-            audio_file.seek(0)
-            data = audio_file.read(dtype="float32")
+        # sf.read opens, reads, and closes in one libsndfile call; the old
+        # explicit handle seeked to 0 even though a fresh read handle is
+        # already positioned there.
+        data, sample_rate = sf.read(audio_path, dtype="float32", always_2d=False)
+        return self._analyze_audio_array(data, sample_rate)
+
+    def _analyze_audio_array(self, data: np.ndarray, sample_rate: int) -> Dict[str, float]:
+        sample_rate = sample_rate or 1
+        frames = data.shape[0] if data.size else 0
 
         if data.size == 0 or frames == 0:
             return {"duration": 0.0, "leading_silence": 0.0, "trailing_silence": 0.0}
 
-        if data.ndim > 1:
-            amplitudes = np.max(np.abs(data), axis=1)
-        else:
-            amplitudes = np.abs(data)
-
-        max_amplitude = float(np.max(amplitudes)) if amplitudes.size else 0.0
+        # One fused scan yields peak amplitude and the first/last samples
+        # above the adaptive threshold (see core._silence).
+        max_amplitude, first_non_silent, last_non_silent = silence_bounds(data)
         if max_amplitude <= 1e-6:
             duration = frames / sample_rate
             return {"duration": duration, "leading_silence": 0.0, "trailing_silence": 0.0}
 
-        adaptive_threshold = max(1e-4, max_amplitude * 0.005)
-        non_silent_indices = np.nonzero(amplitudes >= adaptive_threshold)[0]
-
-        if non_silent_indices.size == 0:
+        if first_non_silent < 0:
             duration = frames / sample_rate
             return {"duration": duration, "leading_silence": 0.0, "trailing_silence": duration}
 
-        first_non_silent = int(non_silent_indices[0])
-        last_non_silent = int(non_silent_indices[-1])
-
         leading_silence = max(0.0, first_non_silent / sample_rate)
         trailing_silence = max(0.0, (frames - last_non_silent - 1) / sample_rate)
         duration = frames / sample_rate
@@ -148,8 +201,13 @@ class KokoroTTSProvider(BaseTTSProvider):
         audio_path: str,
         chunk_records: List[Dict],
         tokens: List[Dict],
+        audio_array: np.ndarray = None,
+        sample_rate: int = None,
+        chunk_token_ranges: List[tuple] = None,
     ) -> List[Dict]:
-        timings = self._build_word_timings_estimate(chunk_records, tokens)
+        timings = self._build_word_timings_estimate(
+            chunk_records, tokens, chunk_token_ranges
+        )
 
         alignment = align_tokens_with_audio(
             audio_path,
@@ -159,6 +217,10 @@ class KokoroTTSProvider(BaseTTSProvider):
             device=getattr(self.config, "alignment_device", getattr(self.config, "device", None)),
             model_name=getattr(self.config, "alignment_model", None),
             batch_size=getattr(self.config, "alignment_batch_size", None),
+            # The chapter waveform is still in memory from the stitch above;
+            # passing it spares the aligner a full decode of audio_path.
+            audio=audio_array,
+            sample_rate=sample_rate,
         )
 
         if alignment and any(entry for entry in alignment if entry):
@@ -169,8 +231,8 @@ class KokoroTTSProvider(BaseTTSProvider):
             for idx, aligned in enumerate(alignment):
                 if not aligned:
                     continue
-                start_ms = int(aligned["start"] * 1000)
-                end_ms = int(aligned["end"] * 1000)
+                start_ms = int(aligned.start * 1000)
+                end_ms = int(aligned.end * 1000)
                 timings[idx]["start_ms"] = start_ms
                 timings[idx]["end_ms"] = max(start_ms, end_ms)
 
@@ -192,50 +254,79 @@ class KokoroTTSProvider(BaseTTSProvider):
         self,
         chunk_records: List[Dict],
         tokens: List[Dict],
+        chunk_token_ranges: List[tuple] = None,
     ) -> List[Dict]:
         timings: List[Dict] = []
         audio_offset = 0.0
 
+        if not tokens:
+            return timings
+
+        # Struct-of-arrays view of the token weights so per-chunk totals are a
+        # vectorized sum instead of a dict-walking loop.
+        weights = np.fromiter(
+            (token["weight"] for token in tokens), dtype=np.int64, count=len(tokens)
+        )
+
+        if chunk_token_ranges is None:
+            # Re-derive chunk boundaries from character offsets when the
+            # caller didn't record them during tokenization.
+            char_starts = np.fromiter(
+                (token["char_start"] for token in tokens),
+                dtype=np.int64,
+                count=len(tokens),
+            )
+            chunk_token_ranges = []
+            lo = 0
+            for record in chunk_records:
+                chunk_end = record["char_offset"] + len(record["text"])
+                hi = int(np.searchsorted(char_starts, chunk_end, side="left"))
+                chunk_token_ranges.append((lo, hi))
+                lo = hi
+
         index = 0
-        for record in chunk_records:
-            chunk_tokens = []
-            chunk_end = record["char_offset"] + len(record["text"])
-            while index < len(tokens) and tokens[index]["char_start"] < chunk_end:
-                chunk_tokens.append(tokens[index])
-                index += 1
+        for (lo, hi), record in zip(chunk_token_ranges, chunk_records):
+            chunk_tokens = tokens[lo:hi]
+            index = hi
 
             if not chunk_tokens:
                 audio_offset += record["duration"]
                 continue
 
-            total_weight = sum(token["weight"] for token in chunk_tokens)
+            chunk_weights = weights[lo:hi].astype(np.float64)
+            total_weight = chunk_weights.sum()
             if total_weight == 0:
                 audio_offset += record["duration"]
                 continue
 
             leading_silence = max(0.0, record.get("leading_silence", 0.0))
             effective_duration = max(0.0, record["duration"] - leading_silence)
-            remaining = effective_duration
-            token_start = audio_offset + leading_silence
-
-            for idx, token in enumerate(chunk_tokens):
-                if idx == len(chunk_tokens) - 1:
-                    token_duration = remaining
-                else:
-                    token_duration = (effective_duration * token["weight"]) / total_weight
-                    remaining = max(0.0, remaining - token_duration)
-
-                token_end = token_start + token_duration
+            base = audio_offset + leading_silence
+
+            # All per-token divisions collapse into two vector expressions;
+            # the last token is pinned to the exact chunk end so rounding
+            # never leaves a gap before the next chunk starts.
+            cum = np.cumsum(chunk_weights)
+            scale = effective_duration / total_weight
+            token_starts_ms = np.rint((base + (cum - chunk_weights) * scale) * 1000)
+            token_ends = base + cum * scale
+            token_ends[-1] = base + effective_duration
+            token_ends_ms = np.rint(token_ends * 1000)
+
+            for token, start_ms, end_ms in zip(
+                chunk_tokens,
+                token_starts_ms.astype(np.int64).tolist(),
+                token_ends_ms.astype(np.int64).tolist(),
+            ):
                 timings.append(
                     {
                         "token": token["value"],
-                        "start_ms": int(round(token_start * 1000)),
-                        "end_ms": int(round(token_end * 1000)),
+                        "start_ms": start_ms,
+                        "end_ms": end_ms,
                         "char_start": token["char_start"],
                         "char_end": token["char_end"],
                     }
                 )
-                token_start = token_end
 
             audio_offset += record["duration"]
 
@@ -255,27 +346,22 @@ class KokoroTTSProvider(BaseTTSProvider):
 
         return timings
 
-    def _determine_token_weight(self, token: str) -> int:
-        stripped = token.strip()
-        if not stripped:
-            return MIN_TOKEN_WEIGHT
-        if stripped in PAUSE_TOKENS:
-            return max(MIN_TOKEN_WEIGHT, len(stripped) + 8)
-        if re.fullmatch(r"[^\w]+", stripped):
-            return max(MIN_TOKEN_WEIGHT, len(stripped) + 4)
-        return max(MIN_TOKEN_WEIGHT, len(stripped))
-
     def _tokenize(self, text: str, base_offset: int):
-        for match in TOKEN_PATTERN.finditer(text):
-            start = base_offset + match.start()
-            end = base_offset + match.end()
+        pattern = TOKEN_PATTERN_ASCII if text.isascii() else TOKEN_PATTERN
+        for match in pattern.finditer(text):
             value = match.group()
+            group = match.lastgroup
+            if group == "word":
+                weight = max(MIN_TOKEN_WEIGHT, len(value))
+            elif group == "pause":
+                weight = PAUSE_WEIGHTS[value]
+            else:
+                weight = max(MIN_TOKEN_WEIGHT, len(value) + 4)
             yield {
                 "value": value,
-                "char_start": start,
-                "char_end": end,
-                "length": end - start,
-                "weight": self._determine_token_weight(value),
+                "char_start": base_offset + match.start(),
+                "char_end": base_offset + match.end(),
+                "weight": weight,
             }
 
     def _write_metadata(
@@ -299,8 +385,14 @@ class KokoroTTSProvider(BaseTTSProvider):
 
         metadata_path = f"{os.path.splitext(output_file)[0]}.json"
 
-        with open(metadata_path, "w", encoding="utf-8") as fp:
-            json.dump(metadata, fp, ensure_ascii=False)
+        # orjson serializes straight to UTF-8 bytes, skipping the Python-level
+        # string encode; word-timing payloads for long chapters are large.
+        if orjson is not None:
+            with open(metadata_path, "wb") as fp:
+                fp.write(orjson.dumps(metadata))
+        else:
+            with open(metadata_path, "w", encoding="utf-8") as fp:
+                json.dump(metadata, fp, ensure_ascii=False)
 
         logger.info("Timing metadata written to %s", metadata_path)
 
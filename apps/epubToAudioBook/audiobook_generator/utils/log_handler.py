@@ -1,8 +1,13 @@
 import logging
+import logging.handlers
 import datetime
 import os
 from pathlib import Path
 
+# (pid, settings) the process was last configured with; lets setup_logging be
+# called freely (e.g. per pool initializer) without re-opening handlers.
+_configured_key = None
+
 def get_formatter(is_worker):
     if is_worker:
         return logging.Formatter(
@@ -13,14 +18,29 @@ def get_formatter(is_worker):
             "%(asctime)s - %(filename)s:%(lineno)d - %(funcName)s - %(levelname)s - %(message)s"
         )
 
-def setup_logging(log_level, log_file=None, is_worker=False):
-    formatter = get_formatter(is_worker)
+def setup_logging(log_level, log_file=None, is_worker=False, queue=None):
+    global _configured_key
+    key = (os.getpid(), log_level, str(log_file), is_worker, queue is not None)
+    if _configured_key == key:
+        # Already configured identically in this process; skip re-opening the
+        # handlers (each reinit costs a file open and flushes in-flight logs).
+        return
 
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     root_logger.setLevel(log_level)
 
+    if queue is not None:
+        # Workers forward records to the parent's QueueListener so a single
+        # writer owns the console and log file instead of every process
+        # appending to them concurrently.
+        root_logger.addHandler(logging.handlers.QueueHandler(queue))
+        _configured_key = key
+        return
+
+    formatter = get_formatter(is_worker)
+
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
@@ -34,6 +54,7 @@ def setup_logging(log_level, log_file=None, is_worker=False):
     file_handler = logging.FileHandler(log_file)
     file_handler.setFormatter(formatter)
     root_logger.addHandler(file_handler)
+    _configured_key = key
 
 def _default_log_dir() -> Path:
     env_override = os.environ.get("ABS_GENERATOR_LOG_DIR")
@@ -1,11 +1,18 @@
 """Utilities to package generated chapter audio into an .m4b container."""
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import os
 import re
+import select
 import subprocess
+import sys
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, Optional, Sequence
 
@@ -14,19 +21,51 @@ logger = logging.getLogger(__name__)
 FFMPEG_BIN = os.environ.get("FFMPEG_BIN", "ffmpeg")
 FFPROBE_BIN = os.environ.get("FFPROBE_BIN", "ffprobe")
 
+PROBE_CACHE_FILENAME = ".ffprobe_cache.json"
+
+# ffmpeg >= 6.0 re-reads segment headers on the concat demuxer when inputs
+# look seekable; -seekable 0 plus a deeper input queue restores the streaming
+# read path.
+M4B_THREAD_QUEUE_SIZE = int(os.environ.get("M4B_THREAD_QUEUE_SIZE", "1024"))
+
+# +faststart rewrites the finished file once to move the moov atom to the
+# front, doubling write I/O for a large .m4b. Setting this to
+# "+frag_keyframe+empty_moov+default_base_moof" produces fragmented MP4 with
+# no rewrite pass, but some players reject fragmented audiobooks, so the
+# compatible default stands.
+M4B_MOVFLAGS = os.environ.get("M4B_MOVFLAGS", "+faststart")
+
+# Kill ffmpeg if it writes nothing to stderr for this long.
+M4B_STALL_SECONDS = float(os.environ.get("M4B_STALL_SECONDS", "300"))
+
+_FFMPEG_TIME_RE = re.compile(r"time=(\d+:\d+:\d+\.\d+)")
+_SLUG_RE = re.compile(r"[^A-Za-z0-9]+")
+_STEM_NUM_PREFIX_RE = re.compile(r"^[0-9]+_?")
+
 
 class M4BPackagingError(RuntimeError):
     """Raised when packaging into an m4b container fails."""
 
 
-def _run_subprocess(args: Sequence[str], *, capture_output: bool = False) -> subprocess.CompletedProcess:
+def _run_subprocess(
+    args: Sequence[str],
+    *,
+    capture_output: bool = False,
+    pass_fds: Sequence[int] = (),
+) -> subprocess.CompletedProcess:
     """Run a subprocess and raise a helpful error on failure."""
     try:
+        # close_fds=False keeps CPython on the posix_spawn fast path instead
+        # of fork + a close() sweep over the fd table; our own pipes are
+        # opened O_CLOEXEC so nothing leaks. pass_fds forces close_fds back
+        # on, which subprocess handles itself.
         result = subprocess.run(
             args,
             check=True,
             text=True,
             capture_output=capture_output,
+            pass_fds=pass_fds,
+            close_fds=bool(pass_fds),
         )
         return result
     except FileNotFoundError as exc:  # pragma: no cover - depends on runtime env
@@ -41,8 +80,81 @@ def _run_subprocess(args: Sequence[str], *, capture_output: bool = False) -> sub
         raise M4BPackagingError(message) from exc
 
 
+def _run_ffmpeg_streaming(args: Sequence[str], *, pass_fds: Sequence[int] = ()) -> None:
+    """Run ffmpeg while streaming its stderr for progress and stall detection.
+
+    capture_output buffers hours of stderr in memory and gives no signal
+    until exit; reading the pipe incrementally surfaces time= progress for
+    the log and lets a watchdog kill a wedged ffmpeg instead of hanging the
+    whole pipeline. Falls back to the buffered runner where select() cannot
+    watch pipes.
+    """
+    if os.name != "posix":  # pragma: no cover - select on pipes is POSIX-only
+        _run_subprocess(args, capture_output=True, pass_fds=pass_fds)
+        return
+
+    try:
+        proc = subprocess.Popen(
+            args,
+            stderr=subprocess.PIPE,
+            pass_fds=pass_fds,
+            close_fds=bool(pass_fds),
+        )
+    except FileNotFoundError as exc:  # pragma: no cover - depends on runtime env
+        raise M4BPackagingError(f"Required binary not found: {args[0]}") from exc
+
+    stderr_fd = proc.stderr.fileno()
+    tail: deque = deque(maxlen=40)
+    buffer = b""
+    try:
+        while True:
+            ready, _, _ = select.select([stderr_fd], [], [], M4B_STALL_SECONDS)
+            if not ready:
+                proc.kill()
+                proc.wait()
+                raise M4BPackagingError(
+                    f"ffmpeg produced no output for {M4B_STALL_SECONDS:.0f}s; killed"
+                    f" stalled command '{' '.join(args)}'"
+                )
+            data = os.read(stderr_fd, 65536)
+            if not data:
+                break
+            # ffmpeg terminates progress updates with \r, regular lines with \n.
+            buffer += data
+            *lines, buffer = re.split(rb"[\r\n]", buffer)
+            for raw_line in lines:
+                line = raw_line.decode("utf-8", errors="replace")
+                if not line:
+                    continue
+                tail.append(line)
+                match = _FFMPEG_TIME_RE.search(line)
+                if match:
+                    logger.debug("ffmpeg progress: %s", match.group(1))
+    finally:
+        proc.stderr.close()
+
+    returncode = proc.wait()
+    if returncode != 0:
+        stderr_tail = "\n".join(tail).strip()
+        raise M4BPackagingError(
+            f"Command '{' '.join(args)}' failed with exit code {returncode}."
+            f" Stderr: {stderr_tail}"
+        )
+
+
 def _probe_duration_ms(audio_path: Path) -> int:
     """Return the duration of the audio file in milliseconds."""
+    # mutagen parses the header in-process in microseconds; spawning ffprobe
+    # costs orders of magnitude more in fork/exec alone. Keep ffprobe as the
+    # fallback for formats mutagen cannot read.
+    try:
+        from mutagen import File as MutagenFile
+
+        audio = MutagenFile(str(audio_path))
+        if audio is not None and audio.info.length > 0:
+            return int(round(audio.info.length * 1000))
+    except Exception:
+        logger.debug("mutagen could not read %s; falling back to ffprobe", audio_path)
     result = _run_subprocess(
         [
             FFPROBE_BIN,
@@ -63,61 +175,318 @@ def _probe_duration_ms(audio_path: Path) -> int:
     return int(round(duration_seconds * 1000))
 
 
+def _detect_audio_codec(audio_path: Path) -> Optional[str]:
+    """Return the codec name of the first audio stream, or None on failure."""
+    try:
+        result = _run_subprocess(
+            [
+                FFPROBE_BIN,
+                "-v",
+                "error",
+                "-select_streams",
+                "a:0",
+                "-show_entries",
+                "stream=codec_name",
+                "-of",
+                "default=nokey=1:noprint_wrappers=1",
+                str(audio_path),
+            ],
+            capture_output=True,
+        )
+    except M4BPackagingError:
+        return None
+    codec = (result.stdout or "").strip()
+    return codec or None
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_has_encoder(encoder: str) -> bool:
+    try:
+        result = _run_subprocess(
+            [FFMPEG_BIN, "-hide_banner", "-encoders"], capture_output=True
+        )
+    except M4BPackagingError:
+        return False
+    return any(
+        line.split()[1:2] == [encoder] for line in (result.stdout or "").splitlines()
+    )
+
+
+def _select_audio_codec_args(first_chapter: Path) -> list[str]:
+    """Pick the cheapest valid audio codec arguments for the m4b mux."""
+    override = os.environ.get("M4B_AUDIO_CODEC")
+    if override:
+        if override == "copy":
+            return ["-c:a", "copy"]
+        return ["-c:a", override, "-b:a", "128k"]
+    if _detect_audio_codec(first_chapter) == "aac":
+        # Already the target codec: muxing with -c:a copy skips the whole
+        # decode/encode round trip and is bounded by disk I/O instead of CPU.
+        return ["-c:a", "copy"]
+    if sys.platform == "darwin" and _ffmpeg_has_encoder("aac_at"):
+        # AudioToolbox encoder is hardware-assisted on Apple hardware.
+        return ["-c:a", "aac_at", "-b:a", "128k"]
+    if _ffmpeg_has_encoder("libfdk_aac"):
+        return ["-c:a", "libfdk_aac", "-b:a", "128k"]
+    return ["-c:a", "aac", "-b:a", "128k"]
+
+
+# Formats where duration follows directly from size at a fixed bitrate.
+_BITRATE_ESTIMATE_SUFFIXES = {".m4a", ".aac", ".mp3"}
+_ESTIMATED_HEADER_BYTES = 2048
+
+
+def _estimate_duration_ms(audio_path: Path, bitrate_bps: int) -> Optional[int]:
+    """Estimate duration from file size for a known constant bitrate.
+
+    For chapters we encoded ourselves the error is bounded by the container
+    header, well within chapter-marker tolerance, and costs one stat instead
+    of a header parse or probe.
+    """
+    try:
+        size = audio_path.stat().st_size
+    except OSError:
+        return None
+    return max(0, size - _ESTIMATED_HEADER_BYTES) * 8000 // bitrate_bps
+
+
+def _probe_cache_key(audio_path: Path) -> Optional[str]:
+    try:
+        stat = audio_path.stat()
+    except OSError:
+        return None
+    # mtime/size in the key makes invalidation automatic: a regenerated
+    # chapter gets a new key and the stale entry is simply never read again.
+    return f"{audio_path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _load_probe_cache(cache_path: Path) -> dict:
+    try:
+        with open(cache_path, "r", encoding="utf-8") as fh:
+            cache = json.load(fh)
+        if isinstance(cache, dict):
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _save_probe_cache(cache_path: Path, cache: dict) -> None:
+    try:
+        with open(cache_path, "w", encoding="utf-8") as fh:
+            json.dump(cache, fh)
+    except OSError:  # pragma: no cover - cache is best-effort
+        logger.debug("Could not write ffprobe cache to %s", cache_path)
+
+
 def _slugify(value: str, fallback: str) -> str:
-    cleaned = re.sub(r"[^A-Za-z0-9]+", "_", value).strip("_")
+    cleaned = _SLUG_RE.sub("_", value).strip("_")
     return cleaned or fallback
 
 
-def _discover_cover_file(folder: Path) -> Optional[Path]:
+def _discover_cover_file(folder: Path, entries: Optional[set] = None) -> Optional[Path]:
+    # One directory listing answers all candidate names; the old per-name
+    # exists()/is_file() pair cost up to ten syscalls, mostly misses.
+    if entries is None:
+        try:
+            entries = {e.name for e in os.scandir(folder) if e.is_file()}
+        except OSError:
+            return None
     for candidate in ("cover.jpg", "Cover.jpg", "cover.jpeg", "cover.png", "Cover.png"):
-        path = folder / candidate
-        if path.exists() and path.is_file():
-            return path
+        if candidate in entries:
+            return folder / candidate
     return None
 
 
-def _build_ffmetadata(
+def _chapter_durations(
+    chapter_list: Sequence[tuple[int, Path, str]],
+    cache_path: Optional[Path] = None,
+    known_durations: Optional[Sequence[Optional[int]]] = None,
+) -> list[int]:
+    """Return the duration in milliseconds for every chapter, in order."""
+    # Durations recorded at generation time beat any kind of probing; the
+    # cache covers reruns (resume, cover regeneration) where the chapter
+    # files are unchanged; only the remainder spawns ffprobe.
+    cache = _load_probe_cache(cache_path) if cache_path is not None else {}
+    cache_keys = [_probe_cache_key(path) for _, path, _ in chapter_list]
+    if known_durations is None:
+        known_durations = [None] * len(chapter_list)
+    durations: list[Optional[int]] = [
+        known if known is not None else (cache.get(key) if key is not None else None)
+        for known, key in zip(known_durations, cache_keys)
+    ]
+
+    # With M4B_CHAPTER_BITRATE set (chapters generated at a known constant
+    # bitrate), remaining durations come from a stat instead of a probe.
+    try:
+        bitrate_bps = int(os.environ.get("M4B_CHAPTER_BITRATE", "0"))
+    except ValueError:
+        bitrate_bps = 0
+    if bitrate_bps > 0:
+        for index, duration in enumerate(durations):
+            path = chapter_list[index][1]
+            if duration is None and path.suffix.lower() in _BITRATE_ESTIMATE_SUFFIXES:
+                durations[index] = _estimate_duration_ms(path, bitrate_bps)
+
+    misses = [index for index, duration in enumerate(durations) if duration is None]
+    # ffprobe calls are subprocess spawns that release the GIL; probing all
+    # chapters concurrently costs roughly one probe instead of one per chapter.
+    if misses:
+        with ThreadPoolExecutor(
+            max_workers=min(len(misses), (os.cpu_count() or 1) * 2)
+        ) as executor:
+            probed = executor.map(
+                _probe_duration_ms, (chapter_list[index][1] for index in misses)
+            )
+        for index, duration_ms in zip(misses, probed):
+            durations[index] = duration_ms
+            if cache_keys[index] is not None:
+                cache[cache_keys[index]] = duration_ms
+        if cache_path is not None:
+            _save_probe_cache(cache_path, cache)
+
+    return durations
+
+
+def _file_list_line(path: Path) -> str:
+    # Single quotes inside a quoted concat entry close the quote, escape the
+    # quote character, and reopen: ' -> '\''
+    return "file '{}'\n".format(str(path).replace("'", "'\\''"))
+
+
+def _build_ffmpeg_inputs(
     *,
     title: str,
     author: str,
-    chapters: Iterable[tuple[int, Path, str]],
-) -> Path:
-    """Create an ffmetadata file describing global tags and chapter markers."""
-    fd, temp_path = tempfile.mkstemp(suffix=".ffmetadata")
-    metadata_path = Path(temp_path)
-    with os.fdopen(fd, "w", encoding="utf-8") as fh:
-        fh.write(";FFMETADATA1\n")
-        fh.write(f"title={title}\n")
-        if author:
-            fh.write(f"artist={author}\n")
-        fh.write("encoder=ffmpeg\n")
-
-        start_ms = 0
-        for idx, path, label in chapters:
-            duration_ms = _probe_duration_ms(path)
-            end_ms = start_ms + duration_ms
-            safe_label = label or f"Chapter {idx}"
-            fh.write("\n[CHAPTER]\n")
-            fh.write("TIMEBASE=1/1000\n")
-            fh.write(f"START={start_ms}\n")
-            fh.write(f"END={end_ms}\n")
-            fh.write(f"title={safe_label}\n")
-            start_ms = end_ms
-    return metadata_path
-
-
-def _build_file_list(chapters: Iterable[tuple[int, Path, str]]) -> Path:
-    fd, temp_path = tempfile.mkstemp(suffix=".txt")
-    file_list_path = Path(temp_path)
+    chapters: Sequence[tuple[int, Path, str]],
+    durations: Sequence[int],
+) -> tuple[str, str]:
+    """Build the ffmetadata document and concat list in a single pass.
+
+    Both inputs walk the same chapter sequence; fusing them avoids a second
+    iteration and keeps each document as one in-memory string flushed with a
+    single write (~6 tiny writes per chapter otherwise).
+    """
+    meta_buf = [";FFMETADATA1\n", f"title={title}\n"]
+    if author:
+        meta_buf.append(f"artist={author}\n")
+    meta_buf.append("encoder=ffmpeg\n")
+    list_buf = []
+
+    start_ms = 0
+    for (idx, path, label), duration_ms in zip(chapters, durations):
+        end_ms = start_ms + duration_ms
+        safe_label = label or f"Chapter {idx}"
+        meta_buf.append(
+            f"\n[CHAPTER]\nTIMEBASE=1/1000\nSTART={start_ms}\nEND={end_ms}\ntitle={safe_label}\n"
+        )
+        list_buf.append(_file_list_line(path))
+        start_ms = end_ms
+    return "".join(meta_buf), "".join(list_buf)
+
+
+def _spool_ffmpeg_input(content: str, suffix: str):
+    """Expose content as an ffmpeg input path.
+
+    On Linux the content lives in an anonymous RAM-backed memfd: no
+    filesystem metadata ops, no fsync exposure, automatic cleanup on close,
+    and the fd is seekable so ffmpeg can probe it freely. Other POSIX
+    systems stream through an anonymous pipe; everything else falls back to
+    a tempfile. Returns (input_arg, pass_fd, tempfile_path, writer_thread)
+    where the last three are None when unused.
+    """
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create(f"m4b{suffix}", os.MFD_CLOEXEC)
+        os.write(fd, content.encode("utf-8"))
+        os.lseek(fd, 0, os.SEEK_SET)
+        return f"/dev/fd/{fd}", fd, None, None
+
+    if os.name == "posix":
+        read_fd, write_fd = os.pipe()
+
+        def _pump():
+            try:
+                with os.fdopen(write_fd, "w", encoding="utf-8") as fh:
+                    fh.write(content)
+            except BrokenPipeError:  # pragma: no cover - ffmpeg exited early
+                logger.debug("ffmpeg closed its input pipe before the writer finished")
+
+        thread = threading.Thread(target=_pump, daemon=True)
+        thread.start()
+        return f"/dev/fd/{read_fd}", read_fd, None, thread
+
+    fd, temp_path = tempfile.mkstemp(suffix=suffix)
     with os.fdopen(fd, "w", encoding="utf-8") as fh:
-        for _, path, _ in chapters:
-            fh.write(f"file '{path}'\n")
-    return file_list_path
+        fh.write(content)
+    return temp_path, None, Path(temp_path), None
+
+
+def _advise_sequential_read(chapters: Sequence[tuple[int, Path, str]]) -> None:
+    """Hint the kernel to read ahead on every chapter before the mux starts.
+
+    The concat demuxer reads segments strictly in order, one at a time;
+    POSIX_FADV_WILLNEED queues readahead for all of them up front so ffmpeg
+    finds warm pages instead of waiting on each file's first read.
+    """
+    if not hasattr(os, "posix_fadvise"):  # pragma: no cover - platform-specific
+        return
+    for _, path, _ in chapters:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:  # pragma: no cover - advisory only
+            pass
+        finally:
+            os.close(fd)
+
+
+def _validate_concat_inputs(chapters: Sequence[tuple[int, Path, str]]) -> None:
+    """Decode every chapter once without encoding to surface bad files early.
+
+    A corrupt chapter discovered mid-encode wastes all the work done up to
+    that point; one ffmpeg null-sink pass over the concat list fails fast
+    instead. Raises M4BPackagingError on the first undecodable segment.
+    """
+    list_arg, list_fd, list_tmp, list_thread = _spool_ffmpeg_input(
+        "".join(_file_list_line(path) for _, path, _ in chapters), ".txt"
+    )
+    pass_fds = (list_fd,) if list_fd is not None else ()
+    try:
+        _run_subprocess(
+            [
+                FFMPEG_BIN,
+                "-hide_banner",
+                "-v",
+                "error",
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                list_arg,
+                "-f",
+                "null",
+                "-",
+            ],
+            capture_output=True,
+            pass_fds=pass_fds,
+        )
+    finally:
+        for fd in pass_fds:
+            os.close(fd)
+        if list_thread is not None:
+            list_thread.join(timeout=5)
+        if list_tmp is not None:
+            list_tmp.unlink(missing_ok=True)
 
 
 def _chapter_title_from_filename(path: Path, index: int) -> str:
     stem = path.stem
-    stem = re.sub(r"^[0-9]+_?", "", stem)
+    stem = _STEM_NUM_PREFIX_RE.sub("", stem)
     stem = stem.replace("_", " ").strip()
     return stem or f"Chapter {index}"
 
@@ -128,45 +497,98 @@ def package_m4b(
     book_id: str,
     book_title: str,
     book_author: str,
-    audio_files: Iterable[tuple[int, str]],
+    audio_files: Iterable[tuple],
 ) -> Optional[Path]:
-    """Create an m4b audiobook from generated chapter audio files."""
+    """Create an m4b audiobook from generated chapter audio files.
+
+    audio_files entries are (index, filename) or (index, filename,
+    duration_ms); a known duration skips probing that chapter entirely.
+    """
+    # One directory read replaces two stat calls per chapter; resolving the
+    # folder once means joining a name needs no further syscalls.
+    try:
+        present = {entry.name for entry in os.scandir(output_folder) if entry.is_file()}
+    except OSError:
+        present = set()
+    resolved_folder = output_folder.resolve()
+
     audio_entries = []
-    for chapter_index, filename in audio_files:
-        candidate = output_folder / filename
-        if not candidate.exists():
+    for entry in audio_files:
+        chapter_index, filename = entry[0], entry[1]
+        known_duration_ms = entry[2] if len(entry) > 2 else None
+        candidate = resolved_folder / filename
+        # The direct exists() check only runs for names outside the snapshot
+        # (e.g. nested paths), keeping the common case syscall-free.
+        if filename not in present and not candidate.exists():
             logger.warning("Skipping missing chapter audio: %s", candidate)
             continue
-        audio_entries.append((chapter_index, candidate.resolve(), _chapter_title_from_filename(candidate, chapter_index)))
+        audio_entries.append(
+            (
+                chapter_index,
+                candidate,
+                _chapter_title_from_filename(candidate, chapter_index),
+                known_duration_ms,
+            )
+        )
 
     if not audio_entries:
         logger.info("No chapter audio available for m4b packaging in %s", output_folder)
         return None
 
     audio_entries.sort(key=lambda item: item[0])
+    known_durations = [entry[3] for entry in audio_entries]
+    audio_entries = [entry[:3] for entry in audio_entries]
 
     title = book_title or book_id
     fallback_slug = _slugify(book_id, "book")
     output_name = f"{_slugify(title, fallback_slug)}.m4b"
     output_path = output_folder / output_name
 
-    metadata_path = _build_ffmetadata(title=title, author=book_author, chapters=audio_entries)
-    file_list_path = _build_file_list(audio_entries)
-    cover_path = _discover_cover_file(output_folder)
+    if os.environ.get("M4B_VALIDATE_INPUTS") == "1":
+        _validate_concat_inputs(audio_entries)
+
+    durations = _chapter_durations(
+        audio_entries,
+        cache_path=output_folder / PROBE_CACHE_FILENAME,
+        known_durations=known_durations,
+    )
+    metadata_content, file_list_content = _build_ffmpeg_inputs(
+        title=title,
+        author=book_author,
+        chapters=audio_entries,
+        durations=durations,
+    )
+    metadata_arg, metadata_fd, metadata_tmp, metadata_thread = _spool_ffmpeg_input(
+        metadata_content, ".ffmetadata"
+    )
+    file_list_arg, file_list_fd, file_list_tmp, file_list_thread = _spool_ffmpeg_input(
+        file_list_content, ".txt"
+    )
+    cover_path = _discover_cover_file(output_folder, present)
 
     ffmpeg_args = [
         FFMPEG_BIN,
         "-hide_banner",
         "-loglevel",
         os.environ.get("FFMPEG_LOGLEVEL", "info"),
+        # Progress lines print regardless of loglevel; the stall watchdog in
+        # _run_ffmpeg_streaming relies on them, so a quiet loglevel must not
+        # silence a healthy run into looking wedged.
+        "-stats",
+        "-thread_queue_size",
+        str(M4B_THREAD_QUEUE_SIZE),
+        "-seekable",
+        "0",
         "-f",
         "concat",
+        # Always -safe 0: entries are absolute paths, and relative ones would
+        # resolve against the list "file" itself, which is a memfd or pipe.
         "-safe",
         "0",
         "-i",
-        str(file_list_path),
+        file_list_arg,
         "-i",
-        str(metadata_path),
+        metadata_arg,
     ]
 
     if cover_path is not None:
@@ -188,11 +610,8 @@ def package_m4b(
         "1",
         "-map_chapters",
         "1",
-        "-c:a",
-        "aac",
-        "-b:a",
-        "128k",
     ])
+    ffmpeg_args.extend(_select_audio_codec_args(audio_entries[0][1]))
 
     if cover_path is not None:
         ffmpeg_args.extend([
@@ -203,20 +622,73 @@ def package_m4b(
         ])
 
     ffmpeg_args.extend([
+        # Output-side option: placed before the first -i it would only scope
+        # to input 0's decoders and the encoder would stay single-threaded.
+        "-threads",
+        os.environ.get("M4B_FFMPEG_THREADS", str(os.cpu_count() or 0)),
         "-movflags",
-        "+faststart",
+        M4B_MOVFLAGS,
         "-y",
         str(output_path),
     ])
 
+    _advise_sequential_read(audio_entries)
+
+    pass_fds = tuple(fd for fd in (file_list_fd, metadata_fd) if fd is not None)
     try:
-        _run_subprocess(ffmpeg_args)
+        _run_ffmpeg_streaming(ffmpeg_args, pass_fds=pass_fds)
     finally:
-        metadata_path.unlink(missing_ok=True)
-        file_list_path.unlink(missing_ok=True)
+        for fd in pass_fds:
+            os.close(fd)
+        for thread in (metadata_thread, file_list_thread):
+            if thread is not None:
+                thread.join(timeout=5)
+        for temp_path in (metadata_tmp, file_list_tmp):
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
 
     logger.info("Packaged m4b audiobook at %s", output_path)
     return output_path
 
 
-__all__ = ["package_m4b", "M4BPackagingError"]
+# Muxing is serialized on one worker: a second concurrent ffmpeg would fight
+# the first for disk bandwidth rather than finish sooner.
+_packaging_executor: Optional[ThreadPoolExecutor] = None
+_packaging_executor_lock = threading.Lock()
+
+
+def package_m4b_async(
+    output_folder: Path,
+    *,
+    book_id: str,
+    book_title: str,
+    book_author: str,
+    audio_files: Iterable[tuple],
+) -> "Future[Optional[Path]]":
+    """Submit package_m4b to a background worker and return its Future.
+
+    Packaging is I/O-bound (stream copy) or single-process CPU-bound (aac
+    encode), so running it in the background lets the caller start the next
+    book's TTS instead of idling behind ffmpeg. Collect the results at
+    end-of-batch via Future.result().
+    """
+    global _packaging_executor
+    with _packaging_executor_lock:
+        if _packaging_executor is None:
+            _packaging_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="m4b-packaging"
+            )
+    # Snapshot before returning in case the caller passed a generator it
+    # intends to keep mutating state behind.
+    audio_files = list(audio_files)
+    return _packaging_executor.submit(
+        package_m4b,
+        output_folder,
+        book_id=book_id,
+        book_title=book_title,
+        book_author=book_author,
+        audio_files=audio_files,
+    )
+
+
+__all__ = ["package_m4b", "package_m4b_async", "M4BPackagingError"]
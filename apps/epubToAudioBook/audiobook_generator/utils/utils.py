@@ -3,6 +3,7 @@ from typing import List
 import tempfile
 import os
 import io
+import soundfile as sf
 from pydub import AudioSegment
 from mutagen.id3._frames import TIT2, TPE1, TALB, TRCK
 from mutagen.id3 import ID3, ID3NoHeaderError
@@ -199,10 +200,63 @@ def save_segment_tmp(segment: io.BytesIO, output_format: str, prefix: str = None
         return tmp_file.name
 
 
+# Lossless read dtype per WAV subtype; int32 covers PCM_16/24/32 exactly.
+_WAV_COPY_DTYPES = {"FLOAT": "float32", "DOUBLE": "float64"}
+
+
+def soundfile_merge_wav_files(tmp_files: List[str], output_file: str) -> bool:
+    """
+    Concatenate same-format WAV files by copying frames with soundfile
+
+    Identical-format WAVs don't need pydub's decode/re-encode round trip (an
+    ffmpeg subprocess per file); copying frames moves each byte once. Returns
+    False when the inputs differ in rate/channels/subtype or aren't WAVs so
+    the caller can fall back to the pydub path.
+
+    Args:
+        tmp_files: List of temporary file paths
+        output_file: Path to the final output file
+    """
+    try:
+        infos = [sf.info(tmp_file) for tmp_file in tmp_files]
+    except RuntimeError:
+        return False
+    first = infos[0]
+    if any(
+        info.format != "WAV"
+        or info.samplerate != first.samplerate
+        or info.channels != first.channels
+        or info.subtype != first.subtype
+        for info in infos
+    ):
+        return False
+    dtype = _WAV_COPY_DTYPES.get(first.subtype)
+    if dtype is None:
+        if not first.subtype.startswith("PCM_"):
+            return False
+        dtype = "int32"
+    with sf.SoundFile(
+        output_file,
+        "w",
+        samplerate=first.samplerate,
+        channels=first.channels,
+        subtype=first.subtype,
+        format="WAV",
+    ) as outfile:
+        for tmp_file in tmp_files:
+            with sf.SoundFile(tmp_file) as infile:
+                while True:
+                    block = infile.read(65536, dtype=dtype)
+                    if len(block) == 0:
+                        break
+                    outfile.write(block)
+    return True
+
+
 def pydub_merge_audio_segments(tmp_files: List[str], output_file: str, output_format: str) -> None:
     """
     Merge multiple audio segments into one and set audio tags
-    
+
     Args:
         tmp_files: List of temporary file paths
         output_file: Path to the final output file
@@ -211,7 +265,13 @@ def pydub_merge_audio_segments(tmp_files: List[str], output_file: str, output_fo
     if not tmp_files:
         logger.warning("No temporary files to merge")
         return
-        
+
+    if output_format == "wav" and soundfile_merge_wav_files(tmp_files, output_file):
+        logger.debug(f"Merged WAV segments with soundfile: {output_file}")
+        for tmp_file in tmp_files:
+            os.remove(tmp_file)
+        return
+
     combined = AudioSegment.empty()
     for tmp_file in tmp_files:
         logger.debug(f"Loading chunk from temporary file: {tmp_file}")
@@ -0,0 +1,75 @@
+import unittest
+
+from audiobook_generator.core.alignment import (
+    _bpm_edit_distance,
+    _diff_opcodes,
+    _myers_opcodes,
+)
+
+
+class TestMyersOpcodes(unittest.TestCase):
+
+    def _validate(self, a, b, opcodes):
+        """Opcodes must tile both sequences and mark truly equal runs."""
+        i = j = 0
+        for tag, i1, i2, j1, j2 in opcodes:
+            self.assertEqual((i1, j1), (i, j))
+            if tag == "equal":
+                self.assertEqual(a[i1:i2], b[j1:j2])
+            i, j = i2, j2
+        self.assertEqual((i, j), (len(a), len(b)))
+
+    def test_identical_sequences(self):
+        a = ["the", "quick", "brown", "fox"]
+        opcodes = _myers_opcodes(a, list(a))
+        self.assertEqual(opcodes, [("equal", 0, 4, 0, 4)])
+
+    def test_insert_delete_replace(self):
+        a = ["one", "two", "three", "four"]
+        b = ["one", "tw0", "three", "five", "four"]
+        opcodes = _myers_opcodes(a, b, max_effort=1.0)
+        self._validate(a, b, opcodes)
+        equal_tokens = [
+            a[i1:i2] for tag, i1, i2, _, _ in opcodes if tag == "equal"
+        ]
+        self.assertIn(["three"], equal_tokens)
+
+    def test_empty_inputs(self):
+        self.assertEqual(_myers_opcodes([], []), [])
+        self._validate(["a"], [], _myers_opcodes(["a"], [], max_effort=1.0))
+        self._validate([], ["a"], _myers_opcodes([], ["a"], max_effort=1.0))
+
+    def test_falls_back_when_over_budget(self):
+        a = ["a"] * 10
+        b = ["b"] * 10
+        self.assertIsNone(_myers_opcodes(a, b, max_effort=0.1))
+        # _diff_opcodes must still produce a valid covering via SequenceMatcher
+        self._validate(a, b, _diff_opcodes(a, b))
+
+
+class TestBpmEditDistance(unittest.TestCase):
+
+    def test_known_distances(self):
+        self.assertEqual(_bpm_edit_distance("kitten", "sitting"), 3)
+        self.assertEqual(_bpm_edit_distance("flaw", "lawn"), 2)
+        self.assertEqual(_bpm_edit_distance("same", "same"), 0)
+
+    def test_empty_strings(self):
+        self.assertEqual(_bpm_edit_distance("", "abc"), 3)
+        self.assertEqual(_bpm_edit_distance("abc", ""), 3)
+        self.assertEqual(_bpm_edit_distance("", ""), 0)
+
+    def test_long_pattern_falls_back(self):
+        # Patterns beyond the 64-bit lane still produce correct distances.
+        self.assertEqual(_bpm_edit_distance("x" * 70, "x" * 70), 0)
+        self.assertEqual(_bpm_edit_distance("x" * 70, "x" * 68), 2)
+
+    def test_long_pattern_against_empty_text(self):
+        # The symmetry swap must not run for an empty text: len 0 is not a
+        # valid bitvector width.
+        self.assertEqual(_bpm_edit_distance("x" * 65, ""), 65)
+        self.assertEqual(_bpm_edit_distance("", "x" * 65), 65)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+
+from audiobook_generator.tts_providers import kokoro_tts_provider
+from audiobook_generator.tts_providers.kokoro_tts_provider import KokoroTTSProvider
+
+
+class TestKokoroTtsProvider(unittest.TestCase):
+
+    def test_single_provider_definition(self):
+        # Guards against a duplicate class definition shadowing the real
+        # provider: the bound methods must come from KokoroTTSProvider itself.
+        self.assertEqual(
+            KokoroTTSProvider.text_to_speech.__qualname__,
+            "KokoroTTSProvider.text_to_speech",
+        )
+        self.assertIs(kokoro_tts_provider.KokoroTTSProvider, KokoroTTSProvider)
+
+    def test_module_all(self):
+        self.assertEqual(kokoro_tts_provider.__all__, ["KokoroTTSProvider"])
+
+
+if __name__ == '__main__':
+    unittest.main()
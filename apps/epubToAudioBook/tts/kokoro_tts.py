@@ -1,20 +1,112 @@
+import numpy as np
+import soundfile as sf
 import torch
-import torchaudio
 from kokoro import KPipeline
 
+SAMPLE_RATE = 24000
+
 class KokoroTTS:
     def __init__(self, repo_id='hexgrad/Kokoro-82M', lang_code="a", device="cuda"):
         self.pipe = KPipeline(repo_id=repo_id, lang_code=lang_code, device=device)
+        self.sample_rate = SAMPLE_RATE
 
-    def synthesize(self, text, voice="af_heart", language=None, output_file="output.wav"):
-        audio_data = []
-        # run Kokoro
-        generator = self.pipe(text, voice=voice)
-        for gs, ps, audio in generator:
-            audio_data.append(audio.unsqueeze(0))
+    def synthesize_array(self, text, voice="af_heart", language=None):
+        """Synthesize `text` and return the waveform as a float32 numpy array.
+
+        Callers that stitch many chunks together (e.g. chapter synthesis)
+        use this instead of `synthesize` so nothing round-trips through a
+        temp WAV: the audio stays in memory until the final write.
+        """
+        if not text:
+            return np.zeros(0, dtype=np.float32)
+        chunks = []
+        for gs, ps, audio in self.pipe(text, voice=voice):
+            chunks.append(audio.detach().cpu().numpy())
+        if not chunks:
+            return np.zeros(0, dtype=np.float32)
+        if len(chunks) == 1:
+            return np.asarray(chunks[0], dtype=np.float32)
+        return np.concatenate(chunks).astype(np.float32, copy=False)
+
+    def synthesize_batch(self, texts, voice="af_heart", language=None):
+        """Synthesize several texts in one pipeline invocation.
 
-        if not audio_data:
+        Returns one float32 waveform per input text. A single call keeps the
+        model hot across all texts instead of re-entering the pipeline per
+        text; outputs are routed back to their inputs via the result's
+        `text_index`. If the installed kokoro doesn't report it, fall back
+        to per-text calls.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        buckets = [[] for _ in texts]
+        for result in self.pipe(texts, voice=voice):
+            index = getattr(result, "text_index", None)
+            if index is None:
+                return [
+                    self.synthesize_array(text, voice=voice, language=language)
+                    for text in texts
+                ]
+            if result.audio is not None:
+                buckets[index].append(result.audio.detach().cpu().numpy())
+        return [
+            np.concatenate(chunks).astype(np.float32, copy=False)
+            if chunks
+            else np.zeros(0, dtype=np.float32)
+            for chunks in buckets
+        ]
+
+    def synthesize(self, text, voice="af_heart", language=None, output_file="output.wav"):
+        # `text` may be a single string or a list of pre-chunked strings.
+        # KPipeline accepts both; handing it the whole list keeps the GPU fed
+        # across chunk boundaries in one call instead of paying pipeline setup
+        # per chunk.
+        if not text:
             return
+        # Stream each generated chunk straight to the WAV writer instead of
+        # accumulating tensors and torch.cat-ing them: peak memory stays at
+        # one chunk and disk I/O overlaps with generation of the next chunk.
+        writer = None
+        copy_stream = None
+        pending = None  # (event, pinned buffer) whose async D2H copy is in flight
+
+        def _drain(entry):
+            event, pinned = entry
+            event.synchronize()
+            writer.write(pinned.numpy())
 
-        full_audio_tensor = torch.cat(audio_data, dim=1)
-        torchaudio.save(output_file, full_audio_tensor.cpu(), 24000)
+        try:
+            for gs, ps, audio in self.pipe(text, voice=voice):
+                if writer is None:
+                    writer = sf.SoundFile(
+                        output_file,
+                        mode="w",
+                        samplerate=SAMPLE_RATE,
+                        channels=1,
+                        subtype="PCM_16",
+                    )
+                audio = audio.detach()
+                if audio.is_cuda:
+                    # Copy into a pinned host buffer on a dedicated stream so
+                    # the device-to-host transfer overlaps with generation of
+                    # the next chunk; the previous chunk is written to disk
+                    # while this copy is in flight.
+                    if copy_stream is None:
+                        copy_stream = torch.cuda.Stream(device=audio.device)
+                    pinned = torch.empty_like(audio, device="cpu", pin_memory=True)
+                    copy_stream.wait_stream(torch.cuda.current_stream(audio.device))
+                    with torch.cuda.stream(copy_stream):
+                        pinned.copy_(audio, non_blocking=True)
+                    event = torch.cuda.Event()
+                    event.record(copy_stream)
+                    if pending is not None:
+                        _drain(pending)
+                    pending = (event, pinned)
+                else:
+                    writer.write(audio.numpy())
+            if pending is not None:
+                _drain(pending)
+        finally:
+            if writer is not None:
+                writer.close()
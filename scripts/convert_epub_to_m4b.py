@@ -120,12 +120,14 @@ def build_config_namespace(
 
 def package_book(folder: Path, book_id: str, manifest: dict) -> Path | None:
     audio_metadata = [
-        (chapter.get("index"), chapter.get("audio"))
+        (chapter.get("index"), chapter.get("audio"), chapter.get("duration_ms"))
         for chapter in manifest.get("chapters", [])
         if chapter.get("status") == "ready"
     ]
     audio_metadata = [
-        (index, name) for index, name in audio_metadata if index is not None and name
+        (index, name, duration_ms)
+        for index, name, duration_ms in audio_metadata
+        if index is not None and name
     ]
 
     if not audio_metadata: